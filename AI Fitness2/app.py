@@ -1,9 +1,28 @@
-from flask import Flask, render_template, request, redirect, url_for, session
+import os
+import sys
+from datetime import datetime, timezone
+
+from flask import Flask, make_response, render_template, request, redirect, url_for, session
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from werkzeug.security import generate_password_hash, check_password_hash
+
+import migrations
+from session_store import make_session_interface
+from user_index import UserIndex
+
+# The repository root holds code shared with the Streamlit app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.validation import validate_measurements, validate_signup
+from diet_plans import build_diet_plan
+from injury_guidance import build_injury_guidance
+
 app = Flask(__name__)
 app.secret_key = 'your_secret_key'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///fitnesscare.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SESSION_BACKEND'] = 'sqlite'  # or 'memory' for a single local process
 
 db = SQLAlchemy(app)
 
@@ -29,6 +48,8 @@ class DietPlan(db.Model):
     calories = db.Column(db.Integer, nullable=True)
     # Add more fields as needed
 
+    __table_args__ = (db.Index('ix_diet_plan_user_created', user_id, created_at.desc()),)
+
 # Injury record table (linked to user)
 class InjuryRecord(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -37,11 +58,23 @@ class InjuryRecord(db.Model):
     recovery_advice = db.Column(db.Text, nullable=False)
     date_reported = db.Column(db.DateTime, nullable=False)
 
-@app.before_request
-def create_tables():
-    db.create_all()
+    __table_args__ = (db.Index('ix_injury_record_user_reported', user_id, date_reported.desc()),)
+
+# Server-side session data; the cookie only carries the random session id
+class ServerSession(db.Model):
+    sid = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.Text, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
 
-users_db = {}
+# Schema changes are applied once per process at startup, never per request
+with app.app_context():
+    migrations.migrate(db.engine, db.metadata)
+    app.session_interface = make_session_interface(app, db.engine, ServerSession.__table__)
+
+# O(1) duplicate checks for signup, warmed from the rows already in the User table
+user_index = UserIndex()
+with app.app_context():
+    user_index.load(db.session.query(User.username, User.email, User.contact))
 
 @app.route('/')
 def home():
@@ -54,43 +87,54 @@ def signup():
         username = request.form['username']
         email = request.form['email']
         password = request.form['password']
-        age = request.form['age']
+        age = request.form.get('age', '')
         contact = request.form['contact']
         gender = request.form['gender']
         address = request.form['address']
 
-        import re
-        email_regex = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-        if not re.match(email_regex, email):
-            error = "Invalid email format."
-        elif len(contact) != 10 or not contact.isdigit():
-            error = "Contact number must be exactly 10 digits."
+        errors = validate_signup({
+            'username': username, 'email': email, 'password': password, 'age': age,
+            'contact': contact, 'gender': gender, 'address': address,
+        })
+        if errors:
+            error = " ".join(errors)
         else:
-            for u in users_db.values():
-                if u['username'] == username:
-                    error = "The username already exist."
-                    break
-                if u['email'] == email:
-                    error = "Email is already existing."
-                    break
-                if u['contact'] == contact:
-                    error = "Contact number is already existing."
-                    break
+            error = user_index.reserve(username, email, contact)
 
         if not error:
-            users_db[email] = {
-                'username': username,
-                'email': email,
-                'password': password,
-                'age': age,
-                'contact': contact,
-                'gender': gender,
-                'address': address,
-                'height': None,
-                'weight': None
-            }
-            session['user_email'] = email
-            return redirect(url_for('dashboard'))
+            try:
+                user = User(
+                    username=username,
+                    email=email,
+                    password=generate_password_hash(password, method='pbkdf2:sha256'),
+                    age=int(age),
+                    contact=contact,
+                    gender=gender,
+                    address=address
+                )
+                db.session.add(user)
+                db.session.commit()
+            except IntegrityError:
+                # Another worker registered one of these values first; the UNIQUE
+                # constraints caught it, so refresh the index and report which one
+                db.session.rollback()
+                user_index.discard(username, email, contact)
+                user_index.load(
+                    db.session.query(User.username, User.email, User.contact)
+                    .filter(or_(User.username == username, User.email == email, User.contact == contact))
+                )
+                error = user_index.conflict(username, email, contact) or "Account already exists."
+            except BaseException:
+                # Any other failure (e.g. "database is locked") must release the claim,
+                # or these values would read as taken for the life of this worker
+                db.session.rollback()
+                user_index.discard(username, email, contact)
+                raise
+            else:
+                session.regenerate()
+                session['user_id'] = user.id
+                session['username'] = user.username
+                return redirect(url_for('dashboard'))
     return render_template('signup.html', error=error)
 
 @app.route('/login', methods=['GET', 'POST'])
@@ -99,53 +143,146 @@ def login():
     if request.method == 'POST':
         email = request.form['email']
         password = request.form['password']
-        user = users_db.get(email)
+        user = db.session.query(User.id, User.username, User.password).filter_by(email=email).first()
         if not user:
             error = "Email not found. Please sign up."
-        elif user['password'] != password:
+        elif not check_password_hash(user.password, password):
             error = "Incorrect password."
         else:
-            session['user_email'] = email
+            # A fresh sid for the authenticated session (see ServerSideSession.regenerate)
+            session.regenerate()
+            session['user_id'] = user.id
+            session['username'] = user.username
             return redirect(url_for('dashboard'))
     return render_template('login.html', error=error)
 
 @app.route('/dashboard', methods=['GET', 'POST'])
 def dashboard():
-    email = session.get('user_email')
-    if not email or email not in users_db:
+    user_id = session.get('user_id')
+    if not user_id:
         return redirect(url_for('login'))
 
-    user = users_db[email]
-    info_needed = not (user.get('height') and user.get('weight') and user.get('age'))
-
+    error = None
     if request.method == 'POST':
-        user['height'] = request.form.get('height')
-        user['weight'] = request.form.get('weight')
-        user['age'] = request.form.get('age')
-        info_needed = not (user.get('height') and user.get('weight') and user.get('age'))
+        form = {field: request.form.get(field, '').strip() for field in ('height', 'weight', 'age')}
+        errors = validate_measurements(form)
+        if errors:
+            error = " ".join(errors)
+        else:
+            db.session.query(User).filter_by(id=user_id).update({
+                'height': float(form['height']),
+                'weight': float(form['weight']),
+                'age': int(form['age'])
+            })
+            store_diet_plan(user_id)
+            db.session.commit()
 
+    # Only the columns the dashboard renders
+    user = db.session.query(User.username, User.height, User.weight, User.age).filter_by(id=user_id).first()
+    if not user:
+        session.clear()
+        return redirect(url_for('login'))
+
+    if error:
+        # Show the form again with what was submitted
+        return render_template('dashboard.html', username=user.username, info_needed=True,
+                               error=error, **form)
+
+    info_needed = not (user.height and user.weight and user.age)
     return render_template(
         'dashboard.html',
-        username=user['username'],
+        username=user.username,
         info_needed=info_needed,
-        height=user.get('height', ''),
-        weight=user.get('weight', ''),
-        age=user.get('age', '')
+        height=user.height or '',
+        weight=user.weight or '',
+        age=user.age or ''
     )
 
 @app.route('/logout')
 def logout():
     session.clear()
+    session.regenerate()
     return redirect(url_for('home'))
 
-# Placeholder routes for diet and injury
+def store_diet_plan(user_id):
+    """Generates the user's diet plan from their saved profile; runs on profile changes, not on views."""
+    user = db.session.query(User.height, User.weight, User.age, User.gender).filter_by(id=user_id).first()
+    if not (user and user.height and user.weight and user.age):
+        return
+    description, calories = build_diet_plan(user.height, user.weight, user.age, user.gender)
+    latest = (
+        db.session.query(DietPlan.description)
+        .filter_by(user_id=user_id)
+        .order_by(DietPlan.created_at.desc())
+        .first()
+    )
+    # Unchanged inputs keep the current plan (and its ETag) instead of adding a copy
+    if latest is None or latest.description != description:
+        db.session.add(DietPlan(user_id=user_id, created_at=datetime.utcnow(),
+                                description=description, calories=calories))
+
+
 @app.route('/diet')
 def diet():
-    return "<h2>Your Diet Plan will appear here.</h2>"
+    user_id = session.get('user_id')
+    if not user_id:
+        return redirect(url_for('login'))
+
+    # Served from ix_diet_plan_user_created; the plan body is only read when it must be rendered
+    latest = (
+        db.session.query(DietPlan.id, DietPlan.created_at)
+        .filter_by(user_id=user_id)
+        .order_by(DietPlan.created_at.desc())
+        .first()
+    )
+    if latest is None:
+        return render_template('diet.html', plan=None)
+
+    etag = f"diet-{latest.id}"
+    last_modified = latest.created_at.replace(microsecond=0, tzinfo=timezone.utc)
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains(etag)
+    else:
+        not_modified = request.if_modified_since is not None and request.if_modified_since >= last_modified
+
+    if not_modified:
+        response = app.response_class(status=304)
+    else:
+        plan = db.session.get(DietPlan, latest.id)
+        response = make_response(render_template('diet.html', plan=plan))
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    # Per-user content: browsers may keep it but must revalidate each time
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add('Cookie')
+    return response
 
-@app.route('/injury')
+@app.route('/injury', methods=['GET', 'POST'])
 def injury():
-    return "<h2>Your Injury Recovery guidance will appear here.</h2>"
+    user_id = session.get('user_id')
+    if not user_id:
+        return redirect(url_for('login'))
+
+    error = None
+    if request.method == 'POST':
+        guidance = build_injury_guidance(request.form.get('injury', ''))
+        if guidance is None:
+            error = "Describe where the injury is (for example knee, shoulder or lower back)."
+        else:
+            injury_type, recovery_advice = guidance
+            db.session.add(InjuryRecord(user_id=user_id, injury_type=injury_type,
+                                        recovery_advice=recovery_advice, date_reported=datetime.utcnow()))
+            db.session.commit()
+            return redirect(url_for('injury'))
+
+    record = (
+        db.session.query(InjuryRecord)
+        .filter_by(user_id=user_id)
+        .order_by(InjuryRecord.date_reported.desc())
+        .first()
+    )
+    return render_template('injury.html', record=record, error=error)
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,19 @@
+from shared import nutrition
+
+# The Flask profile records height, weight, age and sex only, so plans use the
+# shared calculator's default goal and activity level.
+GOAL = nutrition.DEFAULT_GOAL
+ACTIVITY_LEVEL = nutrition.DEFAULT_ACTIVITY
+
+
+def build_diet_plan(height_cm, weight_kg, age, gender):
+    """Returns (description, calories) for a user's profile values."""
+    targets = nutrition.calculate_targets(weight_kg, height_cm, age, ACTIVITY_LEVEL, GOAL, (gender or '').capitalize())
+    description = "\n".join([
+        f"Daily target: {targets.calories} kcal",
+        f"Protein: {targets.protein_g} g | Fat: {targets.fat_g} g | Carbs: {targets.carbs_g} g",
+        f"Goal: {GOAL} at a {ACTIVITY_LEVEL.lower()} activity level "
+        f"(BMR {round(targets.bmr)} kcal, maintenance {targets.tdee} kcal).",
+        f"Based on {height_cm:g} cm, {weight_kg:g} kg, age {age}.",
+    ])
+    return description, targets.calories
@@ -0,0 +1,20 @@
+from shared import injuries
+
+# InjuryRecord.injury_type is a VARCHAR(120)
+INJURY_TYPE_LENGTH = 120
+
+
+def build_injury_guidance(injury_text):
+    """
+    Returns (injury_type, recovery_advice) for a user's free-text injury notes, or
+    None when no catalogued body region is recognised in them.
+    """
+    advisory = injuries.advise(injury_text)
+    if not advisory.regions:
+        return None
+    names = [region.replace('_', ' ') for region in advisory.regions]
+    injury_type = ", ".join(names).capitalize()
+    lines = [f"{name.capitalize()}: {advice}" for name, (_, advice) in zip(names, advisory.advice)]
+    if advisory.avoid:
+        lines.append(f"Avoid for now: {', '.join(advisory.avoid)}.")
+    return injury_type[:INJURY_TYPE_LENGTH], "\n".join(lines)
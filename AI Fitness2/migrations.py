@@ -0,0 +1,61 @@
+from sqlalchemy import text
+
+# The applied schema version is stored in the SQLite header (PRAGMA user_version).
+# Each migration receives an open connection inside a transaction plus the app's
+# SQLAlchemy metadata, and runs exactly once per database.
+
+
+def _create_base_tables(conn, metadata):
+    tables = [metadata.tables[name] for name in ('user', 'diet_plan', 'injury_record')]
+    metadata.create_all(conn, tables=tables)
+
+
+def _create_session_table(conn, metadata):
+    metadata.create_all(conn, tables=[metadata.tables['server_session']])
+
+
+def _add_diet_plan_index(conn, metadata):
+    # Declared on the DietPlan model: (user_id, created_at DESC) for "latest plan" reads
+    for index in metadata.tables['diet_plan'].indexes:
+        index.create(conn, checkfirst=True)
+
+
+def _add_injury_record_index(conn, metadata):
+    # Declared on the InjuryRecord model: (user_id, date_reported DESC) for the latest guidance
+    for index in metadata.tables['injury_record'].indexes:
+        index.create(conn, checkfirst=True)
+
+
+MIGRATIONS = [
+    (1, _create_base_tables),
+    (2, _create_session_table),
+    (3, _add_diet_plan_index),
+    (4, _add_injury_record_index),
+]
+
+
+def schema_version(conn):
+    return conn.execute(text("PRAGMA user_version")).scalar()
+
+
+def migrate(engine, metadata):
+    """Applies every pending migration and returns the resulting schema version."""
+    with engine.connect() as conn:
+        current = schema_version(conn)
+        for version, apply in MIGRATIONS:
+            if version <= current:
+                continue
+            # pysqlite runs DDL and PRAGMAs in autocommit, so the transaction and its
+            # write lock are opened explicitly
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                # Another worker may have migrated while we waited for the write lock
+                if schema_version(conn) < version:
+                    apply(conn, metadata)
+                    conn.exec_driver_sql(f"PRAGMA user_version = {version}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            current = version
+        return schema_version(conn)
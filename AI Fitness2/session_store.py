@@ -0,0 +1,212 @@
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy import delete, insert, select, update
+from werkzeug.datastructures import CallbackDict
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(_session):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.previous_sid = None
+
+    def regenerate(self):
+        """
+        Moves the session to a fresh random sid, keeping its data. Call it whenever
+        the user behind the session changes (login, logout) so a sid planted in the
+        browser beforehand never becomes an authenticated one. The old sid is deleted
+        from the store when the response is saved.
+        """
+        if not self.new and self.previous_sid is None:
+            self.previous_sid = self.sid
+        self.sid = secrets.token_urlsafe(32)
+        self.modified = True
+
+
+# --- Storage backends (pluggable: anything with load/save/delete/sweep) ---
+
+class MemorySessionStore:
+    """Single-process store; useful for local development."""
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def load(self, sid):
+        with self._lock:
+            entry = self._sessions.get(sid)
+        if entry is None or entry[1] < datetime.utcnow():
+            return None
+        return entry[0]
+
+    def save(self, sid, data, expires_at):
+        with self._lock:
+            self._sessions[sid] = (dict(data), expires_at)
+
+    def delete(self, sid):
+        with self._lock:
+            self._sessions.pop(sid, None)
+
+    def sweep(self, now):
+        with self._lock:
+            for sid in [sid for sid, (_, expires_at) in self._sessions.items() if expires_at < now]:
+                del self._sessions[sid]
+
+
+class SqlSessionStore:
+    """Sessions in a table shared by every worker process; survives restarts."""
+
+    def __init__(self, engine, table):
+        self.engine = engine
+        self.table = table
+
+    def load(self, sid):
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                select(self.table.c.data, self.table.c.expires_at).where(self.table.c.sid == sid)
+            ).first()
+        if row is None or row.expires_at < datetime.utcnow():
+            return None
+        return json.loads(row.data)
+
+    def save(self, sid, data, expires_at):
+        values = {'data': json.dumps(dict(data)), 'expires_at': expires_at}
+        with self.engine.begin() as conn:
+            if conn.execute(update(self.table).where(self.table.c.sid == sid).values(**values)).rowcount == 0:
+                conn.execute(insert(self.table).values(sid=sid, **values))
+
+    def delete(self, sid):
+        with self.engine.begin() as conn:
+            conn.execute(delete(self.table).where(self.table.c.sid == sid))
+
+    def sweep(self, now):
+        with self.engine.begin() as conn:
+            conn.execute(delete(self.table).where(self.table.c.expires_at < now))
+
+
+class CachedSessionStore:
+    """
+    In-memory LRU tier in front of another store. Entries are trusted for
+    `revalidate_after` seconds, which bounds how long a change made by another
+    worker (e.g. a logout) can go unseen here.
+    """
+
+    def __init__(self, backend, max_entries=10000, revalidate_after=10.0):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.revalidate_after = revalidate_after
+        self._entries = OrderedDict()  # sid -> (loaded_at, data or None)
+        self._lock = threading.Lock()
+
+    def _remember(self, sid, data):
+        with self._lock:
+            self._entries[sid] = (time.monotonic(), data)
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def load(self, sid):
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is not None and time.monotonic() - entry[0] < self.revalidate_after:
+                self._entries.move_to_end(sid)
+                return entry[1]
+        data = self.backend.load(sid)
+        self._remember(sid, data)
+        return data
+
+    def save(self, sid, data, expires_at):
+        self.backend.save(sid, data, expires_at)
+        self._remember(sid, dict(data))
+
+    def delete(self, sid):
+        self.backend.delete(sid)
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def sweep(self, now):
+        self.backend.sweep(now)
+
+
+# --- Flask integration ---
+
+class ServerSideSessionInterface(SessionInterface):
+    """Keeps only a random session id in the cookie; the data lives in `store`."""
+
+    def __init__(self, store, sweep_interval=300.0):
+        self.store = store
+        self.sweep_interval = sweep_interval
+        self._next_sweep = 0.0
+        self._sweep_lock = threading.Lock()
+
+    def _maybe_sweep(self):
+        now = time.monotonic()
+        if now < self._next_sweep or not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_sweep = now + self.sweep_interval
+            self.store.sweep(datetime.utcnow())
+        finally:
+            self._sweep_lock.release()
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            data = self.store.load(sid)
+            if data is not None:
+                return ServerSideSession(data, sid=sid)
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        self._maybe_sweep()
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.previous_sid is not None:
+            self.store.delete(session.previous_sid)
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+        if not session.modified:
+            return
+
+        self.store.save(session.sid, session, datetime.utcnow() + app.permanent_session_lifetime)
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+
+def make_session_interface(app, engine, table):
+    backend_name = app.config.get('SESSION_BACKEND', 'sqlite')
+    if backend_name == 'memory':
+        backend = MemorySessionStore()
+    elif backend_name == 'sqlite':
+        backend = SqlSessionStore(engine, table)
+    else:
+        raise ValueError(f"Unknown SESSION_BACKEND: {backend_name}")
+    return ServerSideSessionInterface(CachedSessionStore(
+        backend,
+        max_entries=app.config.get('SESSION_CACHE_SIZE', 10000),
+        revalidate_after=app.config.get('SESSION_CACHE_TTL', 10.0),
+    ))
@@ -0,0 +1,53 @@
+import threading
+
+# Checked in this order; the first taken field decides the error shown on signup.
+UNIQUE_FIELDS = (
+    ('username', "The username already exist."),
+    ('email', "Email is already existing."),
+    ('contact', "Contact number is already existing."),
+)
+
+
+class UserIndex:
+    """
+    In-memory secondary hash indexes over the User columns that must be unique, so a
+    signup is checked with three set lookups instead of a scan over every user.
+    Only the claimed values are stored: a signup reserves them before its row (and
+    id) exists, and nothing needs to map a value back to its user. The UNIQUE
+    constraints on the User table remain the source of truth.
+    """
+
+    def __init__(self):
+        self._indexes = {field: set() for field, _ in UNIQUE_FIELDS}
+        self._lock = threading.Lock()
+
+    def load(self, rows):
+        # rows: iterable of (username, email, contact)
+        with self._lock:
+            for username, email, contact in rows:
+                self._add(username=username, email=email, contact=contact)
+
+    def _add(self, **values):
+        for field, value in values.items():
+            self._indexes[field].add(value)
+
+    def conflict(self, username, email, contact):
+        """Returns the error message for the first value already taken, or None."""
+        values = {'username': username, 'email': email, 'contact': contact}
+        for field, message in UNIQUE_FIELDS:
+            if values[field] in self._indexes[field]:
+                return message
+        return None
+
+    def reserve(self, username, email, contact):
+        """Atomically checks and claims all three values; returns an error message or None."""
+        with self._lock:
+            error = self.conflict(username, email, contact)
+            if error is None:
+                self._add(username=username, email=email, contact=contact)
+            return error
+
+    def discard(self, username, email, contact):
+        with self._lock:
+            for field, value in (('username', username), ('email', email), ('contact', contact)):
+                self._indexes[field].discard(value)
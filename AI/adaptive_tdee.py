@@ -0,0 +1,119 @@
+from collections import namedtuple
+from datetime import datetime
+
+import db
+from body_metrics import TIMESTAMP_FORMAT
+from shared import nutrition
+
+# Energy in one kg of body-weight change (the usual ~7700 kcal/kg rule of thumb)
+KCAL_PER_KG = 7700
+
+# Exponential smoothing half-lives. Smoothing factors are derived from the time
+# between entries, so irregular logging weights each entry by how much time it covers.
+TREND_HALF_LIFE_DAYS = 7.0
+SLOPE_HALF_LIFE_DAYS = 14.0
+TDEE_HALF_LIFE_DAYS = 14.0
+
+# An estimate is only produced once the trend spans enough data to mean something,
+# and it is kept within this share of the formula TDEE to contain noisy logs.
+MIN_SAMPLES = 4
+MIN_SPAN_DAYS = 14
+TDEE_BOUNDS = (0.7, 1.3)
+
+TrendState = namedtuple('TrendState', [
+    'user_id', 'trend_kg', 'slope_kg_per_day', 'intake_kcal', 'tdee_kcal', 'samples',
+    'first_recorded_at', 'last_recorded_at', 'last_metric_id',
+])
+
+
+def _days_between(start, end):
+    delta = datetime.strptime(end, TIMESTAMP_FORMAT) - datetime.strptime(start, TIMESTAMP_FORMAT)
+    return delta.total_seconds() / 86400
+
+
+def _alpha(days, half_life):
+    return 1 - 0.5 ** (days / half_life)
+
+
+def update(state, user_id, metric_id, weight_kg, recorded_at, intake_kcal, formula_tdee):
+    """
+    Folds one weight entry into the trend in O(1) and returns the new TrendState.
+    `intake_kcal` is what the user was assumed to eat (their formula calorie target)
+    and `formula_tdee` the Mifflin-St Jeor TDEE used to bound the estimate.
+    """
+    if state is None:
+        return TrendState(user_id, weight_kg, 0.0, intake_kcal, None, 1, recorded_at, recorded_at, metric_id)
+
+    days = _days_between(state.last_recorded_at, recorded_at)
+    if days <= 0:
+        # Entries logged out of order or at the same moment cover no time, so they
+        # don't move the trend or count as samples; they only advance the cursor
+        return state._replace(last_metric_id=max(state.last_metric_id, metric_id))
+
+    # Holt's linear smoothing: project the trend forward by its slope before blending
+    # in the new weight, so a steady gain or loss is tracked without lag
+    projected = state.trend_kg + state.slope_kg_per_day * days
+    trend = projected + _alpha(days, TREND_HALF_LIFE_DAYS) * (weight_kg - projected)
+    rate = (trend - state.trend_kg) / days
+    slope = state.slope_kg_per_day + _alpha(days, SLOPE_HALF_LIFE_DAYS) * (rate - state.slope_kg_per_day)
+    # Intake is averaged over the same horizon as the slope it is compared with
+    intake = state.intake_kcal + _alpha(days, SLOPE_HALF_LIFE_DAYS) * (intake_kcal - state.intake_kcal)
+
+    samples = state.samples + 1
+    tdee = state.tdee_kcal
+    if samples >= MIN_SAMPLES and _days_between(state.first_recorded_at, recorded_at) >= MIN_SPAN_DAYS:
+        # Energy balance: intake minus the energy stored (or released) by the weight trend
+        low, high = TDEE_BOUNDS
+        observed = min(max(intake - slope * KCAL_PER_KG, formula_tdee * low), formula_tdee * high)
+        tdee = observed if tdee is None else tdee + _alpha(days, TDEE_HALF_LIFE_DAYS) * (observed - tdee)
+
+    return TrendState(user_id, trend, slope, intake, tdee, samples, state.first_recorded_at, recorded_at, metric_id)
+
+
+def estimate(state):
+    """The adaptive TDEE in kcal, or None while there is not enough history."""
+    if state is None or state.tdee_kcal is None:
+        return None
+    return int(round(state.tdee_kcal))
+
+
+def _load(conn, user_id):
+    row = conn.execute(f"SELECT {', '.join(TrendState._fields)} FROM tdee_trends WHERE user_id = ?",
+                       (user_id,)).fetchone()
+    return TrendState(*row) if row else None
+
+
+def _save(conn, state):
+    columns = ', '.join(TrendState._fields)
+    assignments = ', '.join(f'{field} = excluded.{field}' for field in TrendState._fields[1:])
+    conn.execute(
+        f"INSERT INTO tdee_trends ({columns}) VALUES ({', '.join('?' * len(TrendState._fields))}) "
+        f"ON CONFLICT (user_id) DO UPDATE SET {assignments}",
+        state
+    )
+
+
+def refresh(user_id, profile, sex=None):
+    """
+    Folds the user's body_metrics entries logged since the last refresh into their
+    stored trend and returns the current estimate (None until there is enough
+    history). Only new entries are read, via idx_body_metrics_user_time, so the cost
+    doesn't grow with the length of the log.
+    """
+    height_cm = nutrition.height_to_cm(profile.height_ft, profile.height_in)
+    with db.connection() as conn:
+        state = original = _load(conn, user_id)
+        rows = conn.execute(
+            "SELECT id, recorded_at, weight_kg FROM body_metrics "
+            "WHERE user_id = ? AND recorded_at >= ? AND id > ? ORDER BY recorded_at, id",
+            (user_id, state.last_recorded_at if state else '', state.last_metric_id if state else 0)
+        ).fetchall()
+        for metric_id, recorded_at, weight_kg in rows:
+            # Intake is assumed from the formula target, never from the adaptive one: that
+            # is derived from this estimate, which would then only measure its own output
+            formula = nutrition.calculate_targets(weight_kg, height_cm, profile.age, profile.activity_level,
+                                                  profile.fitness_goal, sex)
+            state = update(state, user_id, metric_id, weight_kg, recorded_at, formula.calories, formula.tdee)
+        if state is not original:
+            _save(conn, state)
+    return estimate(state)
@@ -0,0 +1,121 @@
+import numpy as np
+
+from shared import nutrition
+
+# Plan ids are positions in nutrition.GOAL_RULES; unknown goals map to the default
+# goal's id, exactly like generate_health_plan falls back to it.
+GOAL_NAMES = tuple(nutrition.GOAL_RULES)
+ACTIVITY_NAMES = tuple(nutrition.ACTIVITY_MULTIPLIERS)
+SEX_NAMES = tuple(nutrition.SEX_CONSTANTS)
+
+PROFILE_COLUMNS = (
+    'hp.user_id', 'hp.age', 'hp.height_ft', 'hp.height_in', 'hp.weight_kg',
+    'hp.activity_level', 'hp.fitness_goal', 'u.gender', 't.tdee_kcal',
+)
+
+
+def _coefficient_table(field, dtype):
+    # nutrition.COEFFICIENTS laid out as a dense goal x activity x sex array
+    table = np.empty((len(GOAL_NAMES), len(ACTIVITY_NAMES), len(SEX_NAMES)), dtype=dtype)
+    for g, goal in enumerate(GOAL_NAMES):
+        for a, activity in enumerate(ACTIVITY_NAMES):
+            for s, sex in enumerate(SEX_NAMES):
+                value = getattr(nutrition.COEFFICIENTS[(goal, activity, sex)], field)
+                table[g, a, s] = -1 if value is None else value
+    return table
+
+
+# Built once at import, like the scalar table they mirror
+ACTIVITY_MULTIPLIER = _coefficient_table('activity_multiplier', np.float64)
+SEX_CONSTANT = _coefficient_table('sex_constant', np.int64)
+CALORIE_OFFSET = _coefficient_table('calorie_offset', np.int64)
+FIXED_CALORIES = _coefficient_table('fixed_calories', np.int64)  # -1 where the goal has no fixed target
+ADAPTIVE_OFFSET = _coefficient_table('adaptive_offset', np.int64)
+PROTEIN_G_PER_KCAL = _coefficient_table('protein_g_per_kcal', np.float64)
+FAT_G_PER_KCAL = _coefficient_table('fat_g_per_kcal', np.float64)
+CARBS_G_PER_KCAL = _coefficient_table('carbs_g_per_kcal', np.float64)
+
+
+def _index(labels, names, default):
+    # Map a column of labels to table positions with one dict lookup per distinct value
+    positions = {name: i for i, name in enumerate(names)}
+    distinct, inverse = np.unique(np.asarray(labels, dtype=object).astype(str), return_inverse=True)
+    codes = np.array([positions.get(label, positions[default]) for label in distinct], dtype=np.int64)
+    return codes[inverse.reshape(-1)]
+
+
+def nutrition_targets(age, height_ft, height_in, weight_kg, activity_level, fitness_goal, sex=None,
+                      adaptive_tdee=None):
+    """
+    Vectorized version of nutrition.calculate_targets for whole columns of profiles.
+    Returns a dict of int64 arrays: plan_id, tdee, calories, protein_g, fat_g, carbs_g.
+    Results are identical to the scalar path: same coefficients, same operation order
+    in float64 and the same truncation/rounding rules. `adaptive_tdee` is the stored
+    tdee_trends.tdee_kcal column (None or NaN where a user has no estimate); it is
+    rounded like adaptive_tdee.estimate and replaces the formula TDEE where present.
+    """
+    age = np.asarray(age, dtype=np.int64)
+    height_ft = np.asarray(height_ft, dtype=np.int64)
+    height_in = np.asarray(height_in, dtype=np.int64)
+    weight_kg = np.asarray(weight_kg, dtype=np.float64)
+    if sex is None:
+        sex = np.full(age.shape, nutrition.DEFAULT_SEX, dtype=object)
+
+    g = _index(fitness_goal, GOAL_NAMES, nutrition.DEFAULT_GOAL)
+    a = _index(activity_level, ACTIVITY_NAMES, nutrition.DEFAULT_ACTIVITY)
+    s = _index(sex, SEX_NAMES, nutrition.DEFAULT_SEX)
+
+    height_cm = (height_ft * 30.48) + (height_in * 2.54)
+    bmr = (10 * weight_kg) + (6.25 * height_cm) - (5 * age) + SEX_CONSTANT[g, a, s]
+    tdee = np.trunc(bmr * ACTIVITY_MULTIPLIER[g, a, s]).astype(np.int64)
+
+    fixed = FIXED_CALORIES[g, a, s]
+    calories = np.where(fixed >= 0, fixed, tdee + CALORIE_OFFSET[g, a, s])
+    if adaptive_tdee is not None:
+        adaptive = np.asarray(adaptive_tdee, dtype=np.float64)
+        known = ~np.isnan(adaptive)
+        # rint rounds half to even, like round() in adaptive_tdee.estimate
+        adaptive = np.rint(np.where(known, adaptive, 0)).astype(np.int64)
+        tdee = np.where(known, adaptive, tdee)
+        calories = np.where(known, adaptive + ADAPTIVE_OFFSET[g, a, s], calories)
+    return {
+        'plan_id': g,
+        'tdee': tdee,
+        'calories': calories,
+        'protein_g': np.rint(calories * PROTEIN_G_PER_KCAL[g, a, s]).astype(np.int64),
+        'fat_g': np.rint(calories * FAT_G_PER_KCAL[g, a, s]).astype(np.int64),
+        'carbs_g': np.rint(calories * CARBS_G_PER_KCAL[g, a, s]).astype(np.int64),
+    }
+
+
+def calorie_targets(age, height_ft, height_in, weight_kg, activity_level, fitness_goal, sex=None,
+                    adaptive_tdee=None):
+    """Returns (calories, plan_ids) as int64 arrays; see nutrition_targets."""
+    targets = nutrition_targets(age, height_ft, height_in, weight_kg, activity_level, fitness_goal, sex,
+                                adaptive_tdee)
+    return targets['calories'], targets['plan_id']
+
+
+def load_profile_columns(conn):
+    """
+    Reads the health_profiles columns the batch path needs, with users.gender and any
+    adaptive TDEE from tdee_trends, as NumPy arrays.
+    """
+    rows = conn.execute(
+        f"SELECT {', '.join(PROFILE_COLUMNS)} FROM health_profiles hp "
+        "JOIN users u ON u.id = hp.user_id "
+        "LEFT JOIN tdee_trends t ON t.user_id = hp.user_id ORDER BY hp.user_id"
+    ).fetchall()
+    columns = list(zip(*rows)) if rows else [()] * len(PROFILE_COLUMNS)
+    names = [column.split('.')[1] for column in PROFILE_COLUMNS]
+    return {name: np.array(values, dtype=object) for name, values in zip(names, columns)}
+
+
+def cohort_nutrition_targets(conn):
+    columns = load_profile_columns(conn)
+    targets = nutrition_targets(
+        columns['age'], columns['height_ft'], columns['height_in'], columns['weight_kg'],
+        columns['activity_level'], columns['fitness_goal'], columns['gender'], columns['tdee_kcal'],
+    )
+    targets['user_id'] = columns['user_id'].astype(np.int64)
+    return targets
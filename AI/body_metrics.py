@@ -0,0 +1,66 @@
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+import db
+
+# Timestamps are stored as UTC 'YYYY-MM-DD HH:MM:SS' text (SQLite's datetime()
+# format), so they sort and compare correctly as strings.
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_WINDOW = timedelta(days=365)
+
+# Bucket -> SQL expression for the start of the period containing recorded_at.
+# Weeks start on Monday.
+BUCKETS = {
+    'day': "date(recorded_at)",
+    'week': "date(recorded_at, 'weekday 0', '-6 days')",
+    'month': "strftime('%Y-%m-01', recorded_at)",
+}
+
+WeightPoint = namedtuple('WeightPoint', ['period', 'avg_kg', 'min_kg', 'max_kg', 'samples'])
+
+
+def _timestamp(value):
+    return value.strftime(TIMESTAMP_FORMAT) if isinstance(value, datetime) else value
+
+
+def record_weights(entries):
+    """
+    Appends (user_id, weight_kg, recorded_at) entries in one transaction with a single
+    executemany. recorded_at may be a datetime, a timestamp string or None for now.
+    Profile saves record their weight through a trigger and don't need to call this.
+    """
+    now = datetime.utcnow()
+    rows = [(user_id, weight_kg, _timestamp(recorded_at or now)) for user_id, weight_kg, recorded_at in entries]
+    oldest = {}
+    for user_id, _, recorded_at in rows:
+        oldest[user_id] = min(recorded_at, oldest.get(user_id, recorded_at))
+    with db.connection() as conn:
+        conn.executemany("INSERT INTO body_metrics (user_id, weight_kg, recorded_at) VALUES (?, ?, ?)", rows)
+        # adaptive_tdee folds entries in time order; backfilled ones predate a user's
+        # trend, so drop it and let the next refresh rebuild it from the full history
+        conn.executemany("DELETE FROM tdee_trends WHERE user_id = ? AND last_recorded_at > ?", oldest.items())
+    return len(rows)
+
+
+def weight_history(user_id, bucket='week', start=None, end=None):
+    """
+    A user's weight between `start` (default: a year before `end`) and `end` (default:
+    now), averaged per day, week or month in SQL. Returns WeightPoints oldest first;
+    the query is a single range scan of idx_body_metrics_user_time.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown bucket: {bucket}")
+    end = end or datetime.utcnow()
+    start = start or end - DEFAULT_WINDOW
+    with db.connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT {BUCKETS[bucket]} AS period, AVG(weight_kg), MIN(weight_kg), MAX(weight_kg), COUNT(*)
+            FROM body_metrics
+            WHERE user_id = ? AND recorded_at >= ? AND recorded_at <= ?
+            GROUP BY period
+            ORDER BY period
+            """,
+            (user_id, _timestamp(start), _timestamp(end))
+        ).fetchall()
+    return [WeightPoint(*row) for row in rows]
@@ -0,0 +1,106 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+DB_PATH = 'credentials.db'
+POOL_SIZE = 8
+POOL_TIMEOUT = 30.0  # seconds to wait for a free pooled connection
+BUSY_TIMEOUT = 5.0  # seconds a statement waits for another connection's lock
+
+# Applied to every new pooled connection. journal_mode=WAL is persistent in the
+# database file, the rest are per-connection settings.
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",
+)
+
+
+class PoolTimeout(sqlite3.OperationalError):
+    pass
+
+
+class ConnectionPool:
+    """
+    Bounded pool of SQLite connections.
+    - At most `max_size` connections exist at any time; callers wait for a free one.
+    - A thread that already holds a connection gets the same one back (nested use).
+    - Connections are returned to the pool and reused instead of being closed.
+    """
+
+    def __init__(self, path=DB_PATH, max_size=POOL_SIZE, timeout=POOL_TIMEOUT):
+        self.path = path
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            # Re-entrant use from the same thread shares the outer transaction
+            yield held
+            return
+
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout("Timed out waiting for a database connection.")
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._local.conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._idle.put(conn)
+            self._slots.release()
+
+    def close_all(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._idle = queue.LifoQueue()
+
+
+# --- Process-wide pool (modules imported by the Streamlit script survive reruns) ---
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def connection():
+    return get_pool().connection()
@@ -0,0 +1,194 @@
+"""
+Generates health plans for every stored profile, offline, and writes them as
+numbered part files of JSON lines (or Parquet when pyarrow is installed).
+
+    python export_plans.py OUT_DIR [--db credentials.db] [--format jsonl|parquet]
+                           [--workers N] [--page-size N] [--part-rows N] [--resume]
+
+Profiles are read in user_id order one keyset page at a time and built by a
+pool of worker processes, with a bounded number of pages in flight, so memory
+stays flat however many profiles there are. Each part file is written under a
+temporary name and renamed when complete, then checkpoint.json records the last
+user_id it contains; --resume carries on after that user_id.
+
+The database is opened read-only and never migrated: an export must not change
+or lock a live file, so a database behind the app's schema is refused instead.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sqlite3
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+# The repository root holds code shared with the Flask app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db
+import migrations
+from health_profile import HealthProfile
+from plans import generate_health_plan, plan_to_dict
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+CHECKPOINT = 'checkpoint.json'
+FORMATS = ('jsonl', 'parquet')
+
+# One row per profile with the user's sex and any adaptive TDEE estimate
+PAGE_QUERY = (
+    f"SELECT {', '.join('hp.' + column for column in HealthProfile.COLUMNS)}, u.gender, t.tdee_kcal "
+    "FROM health_profiles hp "
+    "JOIN users u ON u.id = hp.user_id "
+    "LEFT JOIN tdee_trends t ON t.user_id = hp.user_id "
+    "WHERE hp.user_id > ? ORDER BY hp.user_id LIMIT ?"
+)
+
+
+def connect_read_only(db_path):
+    """Opens the database read-only and checks it is at the schema this code reads."""
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    version, expected = migrations.schema_version(conn), migrations.MIGRATIONS[-1][0]
+    if version < expected:
+        conn.close()
+        raise ValueError(f"{db_path} is at schema version {version} but the export needs {expected}; "
+                         "start the app once to migrate it, then rerun the export.")
+    return conn
+
+
+def read_pages(conn, after_user_id, page_size):
+    """
+    Yields lists of profile rows after `after_user_id`, in user_id order. SQLite has
+    no server-side cursors, so each page is its own short query that seeks past the
+    previous page's last user_id on the primary key index instead of using OFFSET.
+    """
+    while True:
+        rows = conn.execute(PAGE_QUERY, (after_user_id, page_size)).fetchall()
+        if not rows:
+            return
+        yield rows
+        after_user_id = rows[-1][0]
+
+
+def build_plans(rows):
+    """Worker: returns (user_id, goal, calories, plan JSON) for each profile row."""
+    results = []
+    for row in rows:
+        profile = HealthProfile.from_row(row[:len(HealthProfile.COLUMNS)])
+        sex, tdee_kcal = row[len(HealthProfile.COLUMNS):]
+        # Rounded like adaptive_tdee.estimate
+        tdee = None if tdee_kcal is None else int(round(tdee_kcal))
+        plan = generate_health_plan(profile, sex, tdee)
+        results.append((profile.user_id, plan.goal, plan.calories, json.dumps(plan_to_dict(plan))))
+    return results
+
+
+def write_part(out_dir, number, rows, fmt):
+    """Writes one complete part file atomically and returns its path."""
+    path = os.path.join(out_dir, f"plans-{number:05d}.{fmt}")
+    partial = path + '.tmp'
+    if fmt == 'parquet':
+        user_ids, goals, calories, plans = zip(*rows)
+        table = pyarrow.table({'user_id': user_ids, 'goal': goals, 'calories': calories, 'plan': plans})
+        pyarrow.parquet.write_table(table, partial)
+    else:
+        with open(partial, 'w', encoding='utf-8') as f:
+            f.writelines(f'{{"user_id": {user_id}, "plan": {plan}}}\n' for user_id, _, _, plan in rows)
+    os.replace(partial, path)
+    return path
+
+
+def load_checkpoint(out_dir):
+    with open(os.path.join(out_dir, CHECKPOINT), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_checkpoint(out_dir, checkpoint):
+    path = os.path.join(out_dir, CHECKPOINT)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(path + '.tmp', path)
+
+
+def export(db_path, out_dir, fmt='jsonl', workers=None, page_size=1000, part_rows=50000, resume=False,
+           log=sys.stderr):
+    """Runs the export and returns the number of plans written by this run."""
+    conn = connect_read_only(db_path)
+    os.makedirs(out_dir, exist_ok=True)
+    if resume and os.path.exists(os.path.join(out_dir, CHECKPOINT)):
+        checkpoint = load_checkpoint(out_dir)
+    else:
+        checkpoint = {'last_user_id': 0, 'next_part': 0, 'rows': 0}
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    written = 0
+    buffer = []
+
+    def flush(final=False):
+        nonlocal buffer, written
+        while len(buffer) >= part_rows or (final and buffer):
+            part, buffer = buffer[:part_rows], buffer[part_rows:]
+            path = write_part(out_dir, checkpoint['next_part'], part, fmt)
+            written += len(part)
+            checkpoint.update(last_user_id=part[-1][0], next_part=checkpoint['next_part'] + 1,
+                              rows=checkpoint['rows'] + len(part))
+            save_checkpoint(out_dir, checkpoint)
+            rate = written / max(time.perf_counter() - started, 1e-9)
+            print(f"{os.path.basename(path)}: {checkpoint['rows']} plans, {rate:,.0f} rows/s", file=log)
+
+    try:
+        with multiprocessing.Pool(workers) as processes:
+            # Pages are collected in submission order, so parts stay in user_id order
+            # and the checkpoint never skips a profile
+            pending = deque()
+            for rows in read_pages(conn, checkpoint['last_user_id'], page_size):
+                pending.append(processes.apply_async(build_plans, (rows,)))
+                if len(pending) >= 2 * workers:
+                    buffer.extend(pending.popleft().get())
+                    flush()
+            while pending:
+                buffer.extend(pending.popleft().get())
+                flush()
+            flush(final=True)
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"Done: {written} plans in {elapsed:.1f}s ({written / max(elapsed, 1e-9):,.0f} rows/s), "
+          f"{checkpoint['rows']} in total.", file=log)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate health plans for every stored profile.")
+    parser.add_argument('out_dir', help="directory for the part files and checkpoint")
+    parser.add_argument('--db', default=db.DB_PATH, help="SQLite database (default: %(default)s)")
+    parser.add_argument('--format', choices=FORMATS, default='jsonl')
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--page-size', type=int, default=1000, help="profiles read and built per task")
+    parser.add_argument('--part-rows', type=int, default=50000, help="plans per output file")
+    parser.add_argument('--resume', action='store_true', help="continue after the checkpointed user_id")
+    args = parser.parse_args(argv)
+
+    if args.format == 'parquet' and pyarrow is None:
+        parser.error("--format parquet needs pyarrow installed")
+    if not os.path.exists(args.db):
+        parser.error(f"database not found: {args.db}")
+    if not args.resume and os.path.exists(os.path.join(args.out_dir, CHECKPOINT)):
+        parser.error(f"{args.out_dir} already holds an export; pass --resume or use an empty directory")
+
+    try:
+        export(args.db, args.out_dir, args.format, args.workers, args.page_size, args.part_rows, args.resume)
+    except ValueError as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+import bcrypt
+
+# bcrypt releases the GIL while hashing, so a thread pool gives real parallelism
+# without the pickling cost of a process pool.
+HASH_WORKERS = int(os.environ.get('AIFIT_HASH_WORKERS', min(4, os.cpu_count() or 1)))
+HASH_QUEUE_LIMIT = int(os.environ.get('AIFIT_HASH_QUEUE_LIMIT', HASH_WORKERS * 4))
+HASH_TIMEOUT = float(os.environ.get('AIFIT_HASH_TIMEOUT', 10.0))
+
+# Shown on both the login and registration pages
+BUSY_MESSAGE = "Too many requests right now. Please try again in a moment."
+
+
+class HashingBusy(Exception):
+    """Raised instead of queueing when the hashing pool is saturated, or when a queued hash times out."""
+
+
+class HashingPool:
+    def __init__(self, workers=HASH_WORKERS, queue_limit=HASH_QUEUE_LIMIT, timeout=HASH_TIMEOUT):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bcrypt')
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._peak_queue_depth = 0
+
+    def _queue_depth(self):
+        return max(0, self._in_flight - self.workers)
+
+    def _release(self, _future):
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def _run(self, fn, *args):
+        with self._lock:
+            if self._in_flight >= self.workers + self.queue_limit:
+                self._rejected += 1
+                raise HashingBusy(BUSY_MESSAGE)
+            self._in_flight += 1
+            self._submitted += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queue_depth())
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            # The hash still finishes in the background and releases its slot then
+            with self._lock:
+                self._timed_out += 1
+            raise HashingBusy(BUSY_MESSAGE) from None
+
+    def hash_password(self, password):
+        return self._run(_hash, password.encode('utf-8'))
+
+    def check_password(self, password, stored_hash):
+        if isinstance(stored_hash, str):
+            stored_hash = stored_hash.encode('utf-8')
+        return self._run(bcrypt.checkpw, password.encode('utf-8'), stored_hash)
+
+    def metrics(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'queue_limit': self.queue_limit,
+                'in_flight': self._in_flight,
+                'queue_depth': self._queue_depth(),
+                'peak_queue_depth': self._peak_queue_depth,
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'rejected': self._rejected,
+                'timed_out': self._timed_out,
+            }
+
+
+def _hash(password_bytes):
+    return bcrypt.hashpw(password_bytes, bcrypt.gensalt())
+
+
+# --- Process-wide pool shared by every Streamlit session ---
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HashingPool()
+    return _pool
+
+
+def hash_password(password):
+    return get_pool().hash_password(password)
+
+
+def check_password(password, stored_hash):
+    return get_pool().check_password(password, stored_hash)
+
+
+def metrics():
+    return get_pool().metrics()
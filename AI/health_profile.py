@@ -0,0 +1,56 @@
+class HealthProfile:
+    """
+    One user's health profile, read by column name rather than by position in a
+    SELECT * row. Values are normalised on construction (ints, a float weight and
+    '' for no injury/illness), and the record is immutable and hashable, so equal
+    profiles compare and hash equal however the row was produced.
+    """
+
+    __slots__ = (
+        'user_id', 'age', 'height_ft', 'height_in', 'weight_kg', 'activity_level', 'fitness_goal',
+        'dietary_preference', 'physical_injury', 'medical_illness',
+    )
+
+    # Queries select exactly these columns, in this order, and pass the row to from_row()
+    COLUMNS = __slots__
+    SELECT_LIST = ', '.join(__slots__)
+
+    def __init__(self, user_id, age, height_ft, height_in, weight_kg, activity_level, fitness_goal,
+                 dietary_preference, physical_injury, medical_illness):
+        set_field = object.__setattr__
+        set_field(self, 'user_id', user_id)
+        set_field(self, 'age', int(age))
+        set_field(self, 'height_ft', int(height_ft))
+        set_field(self, 'height_in', int(height_in))
+        set_field(self, 'weight_kg', float(weight_kg))
+        set_field(self, 'activity_level', activity_level)
+        set_field(self, 'fitness_goal', fitness_goal)
+        set_field(self, 'dietary_preference', dietary_preference)
+        set_field(self, 'physical_injury', physical_injury or '')
+        set_field(self, 'medical_illness', medical_illness or '')
+
+    @classmethod
+    def from_row(cls, row):
+        return None if row is None else cls(*row)
+
+    def astuple(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # Rebuild through __init__ so pickling and copying work despite __setattr__
+        return type(self), self.astuple()
+
+    def __eq__(self, other):
+        if not isinstance(other, HealthProfile):
+            return NotImplemented
+        return self.astuple() == other.astuple()
+
+    def __hash__(self):
+        return hash(self.astuple())
+
+    def __repr__(self):
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.__slots__)
+        return f'{type(self).__name__}({fields})'
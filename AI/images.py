@@ -0,0 +1,105 @@
+import hashlib
+import os
+import threading
+import urllib.request
+
+from PIL import Image
+
+# Resized, re-encoded copies of page images live in static/cache/, named after the
+# source's content hash so a changed source never serves a stale variant.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, 'static', 'cache')
+PLACEHOLDER = os.path.join(BASE_DIR, 'static', 'placeholder.jpg')
+JPEG_QUALITY = 82
+FETCH_TIMEOUT = 10
+
+_variants = {}  # (source, width, source mtime) -> variant path
+_downloads = set()  # URLs with a background fetch already started
+_lock = threading.Lock()
+
+
+def _is_remote(source):
+    return source.startswith(('http://', 'https://'))
+
+
+def _content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def _render_variant(path, width):
+    name = os.path.splitext(os.path.basename(path))[0]
+    target = os.path.join(CACHE_DIR, f'{name}-{width}w-{_content_hash(path)}.jpg')
+    if not os.path.exists(target):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with Image.open(path) as image:
+            image.draft('RGB', (width, width))  # lets the JPEG decoder skip full-resolution decoding
+            image = image.convert('RGB')
+            if image.width > width:
+                image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+            tmp = f'{target}.{threading.get_ident()}.tmp'
+            image.save(tmp, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+        os.replace(tmp, target)
+    return target
+
+
+def _download_path(url):
+    return os.path.join(CACHE_DIR, f'remote-{hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]}.img')
+
+
+def _download(url):
+    target = _download_path(url)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with urllib.request.urlopen(url, timeout=FETCH_TIMEOUT) as response:
+            data = response.read()
+        tmp = f'{target}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, target)
+    except OSError:
+        # Leave the placeholder in use; the next process start retries
+        pass
+
+
+def _local_source(source):
+    """Returns a local file for `source`, or None while it is missing or still downloading."""
+    if not _is_remote(source):
+        path = source if os.path.isabs(source) else os.path.join(BASE_DIR, source)
+        return path if os.path.exists(path) else None
+
+    path = _download_path(source)
+    if os.path.exists(path):
+        return path
+    with _lock:
+        if source not in _downloads:
+            _downloads.add(source)
+            threading.Thread(target=_download, args=(source,), daemon=True).start()
+    return None
+
+
+def variant(source, width):
+    """
+    Path to a `width`-pixel JPEG of a local file or URL. Never blocks on the network:
+    remote images are fetched in the background and the placeholder is used until then.
+    """
+    path = _local_source(source) or PLACEHOLDER
+    key = (path, width, os.path.getmtime(path))
+    cached = _variants.get(key)
+    if cached is not None and os.path.exists(cached):
+        return cached
+    try:
+        result = _render_variant(path, width)
+    except OSError:
+        result = PLACEHOLDER
+    _variants[key] = result
+    return result
+
+
+def warm(sources):
+    """Builds variants (and starts remote fetches) ahead of the first page render."""
+    for source, width in sources:
+        variant(source, width)
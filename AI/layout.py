@@ -0,0 +1,95 @@
+import streamlit as st
+
+import images
+import profile_session
+import static_content
+
+
+def set_page(page_name):
+    st.session_state.current_page = page_name
+
+
+# --- Define the Header and Footer functions ---
+def show_header():
+    # Simple, non-intrusive header for the top of the main content
+    st.markdown(static_content.HEADER_HTML, unsafe_allow_html=True)
+
+
+def show_footer():
+    # --- FINAL MODIFIED FOOTER LAYOUT (Using Links and minimal logic) ---
+    st.markdown("---")
+
+    # 1. Create a container for the hidden buttons (must be visible in the Streamlit flow)
+    col_hidden = st.columns([1])[0]
+
+
+
+
+    # 2. Inject styled HTML links and copyright text (styles live in static/app.css)
+    st.markdown(static_content.FOOTER_HTML, unsafe_allow_html=True)
+
+
+def show_sidebar_navigation():
+    # Dynamic sidebar for logged-in users (NOW INCLUDES ABOUT AND CONTACT)
+    with st.sidebar:
+        st.markdown(f"## Welcome, {st.session_state.username} 👋")
+        st.markdown("---")
+
+        # Keys are now explicitly suffixed with '_sidebar' to guarantee uniqueness
+        st.button("👤 Profile", key="nav_profile_sidebar", use_container_width=True, on_click=set_page,
+                  args=('profile_page',))
+        st.button("📈 Health Plan", key="nav_plan_sidebar", use_container_width=True, on_click=set_page,
+                  args=('health_plan',))
+        st.button("⚙️ Edit Profile", key="nav_edit_sidebar", use_container_width=True, on_click=set_page,
+                  args=('edit_profile',))
+        st.markdown("---")
+        # NEW NAVIGATION BUTTONS IN SIDEBAR
+        st.button("ℹ️ About Us", key="nav_about_sidebar", use_container_width=True, on_click=set_page,
+                  args=('about',))
+        st.button("📞 Contact Us", key="nav_contact_sidebar", use_container_width=True, on_click=set_page,
+                  args=('contact',))
+        st.markdown("---")
+        # END NEW NAVIGATION BUTTONS
+
+        # Logout button
+        if st.button("🚪 Log out", key="nav_logout_sidebar", use_container_width=True):
+            st.session_state.username = None
+            profile_session.clear()
+            set_page('home')
+
+
+# --- Page images (resized once into static/cache by images.py) ---
+HERO_IMAGE_WIDTH = 1200
+PROFILE_IMAGE_WIDTH = 600
+STRENGTH_IMAGE_URL = "https://images.unsplash.com/photo-1549576490-b0b4831ef60a?q=80&w=600&auto=format&fit=crop"
+PAGE_IMAGES = (
+    ("AI.jpg", HERO_IMAGE_WIDTH),
+    (STRENGTH_IMAGE_URL, PROFILE_IMAGE_WIDTH),
+    ("ef.jpg", PROFILE_IMAGE_WIDTH),
+    ("ar1.jpg", PROFILE_IMAGE_WIDTH),
+)
+
+
+@st.cache_resource
+def warm_image_cache():
+    # Once per process: resize local images and start remote fetches before any page needs them
+    images.warm(PAGE_IMAGES)
+
+
+def add_fitness_images():
+    """Adds a row of contrasting fitness images below the profile snapshot."""
+    image_col1, image_col2, image_col3 = st.columns(3)
+
+    # Using high-contrast, relevant images, served as pre-resized variants (see images.py)
+    with image_col1:
+        st.image(images.variant(STRENGTH_IMAGE_URL, PROFILE_IMAGE_WIDTH),
+                 caption="Strength Training", use_container_width=True)
+    with image_col2:
+        # Endurance Focus - Using local file placeholder
+        st.image(images.variant("ef.jpg", PROFILE_IMAGE_WIDTH),
+                 caption="Endurance Focus", use_container_width=True)
+    with image_col3:
+        # Active Recovery - Using local file placeholder
+        st.image(images.variant("ar1.jpg", PROFILE_IMAGE_WIDTH),
+                 caption="Active Recovery", use_container_width=True)
+    st.markdown("---")
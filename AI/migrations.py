@@ -0,0 +1,142 @@
+import sqlite3
+
+# The applied schema version is stored in the database header (PRAGMA user_version).
+# Each migration runs once, in order, and bumps the version in the same transaction.
+
+
+def _create_base_tables(cursor):
+    cursor.execute('''
+                   CREATE TABLE IF NOT EXISTS users
+                   (
+                       id            INTEGER PRIMARY KEY,
+                       username      TEXT NOT NULL UNIQUE,
+                       contact       TEXT NOT NULL UNIQUE,
+                       email         TEXT NOT NULL UNIQUE,
+                       gender        TEXT NOT NULL,
+                       address       TEXT NOT NULL,
+                       password_hash TEXT NOT NULL
+                   )
+                   ''')
+    cursor.execute('''
+                   CREATE TABLE IF NOT EXISTS health_profiles
+                   (
+                       id             INTEGER PRIMARY KEY,
+                       user_id        INTEGER NOT NULL UNIQUE,
+                       age            INTEGER,
+                       height_ft      INTEGER,
+                       height_in      INTEGER,
+                       weight_kg      REAL,
+                       activity_level TEXT,
+                       fitness_goal   TEXT,
+                       FOREIGN KEY (user_id) REFERENCES users (id)
+                   )
+                   ''')
+
+
+def _add_profile_condition_columns(cursor):
+    # Databases created before these columns existed are upgraded in place
+    existing = {row[1] for row in cursor.execute("PRAGMA table_info(health_profiles)")}
+    for column in ("dietary_preference", "physical_injury", "medical_illness"):
+        if column not in existing:
+            cursor.execute(f"ALTER TABLE health_profiles ADD COLUMN {column} TEXT")
+
+
+def _create_body_metrics(cursor):
+    # Append-only weight history. The index leads with (user_id, recorded_at) so a
+    # user's date range is one range scan, and carries weight_kg so it covers it.
+    cursor.execute('''
+                   CREATE TABLE IF NOT EXISTS body_metrics
+                   (
+                       id          INTEGER PRIMARY KEY,
+                       user_id     INTEGER NOT NULL REFERENCES users (id),
+                       recorded_at TEXT    NOT NULL DEFAULT (datetime('now')),
+                       weight_kg   REAL    NOT NULL
+                   )
+                   ''')
+    cursor.execute('''
+                   CREATE INDEX IF NOT EXISTS idx_body_metrics_user_time
+                       ON body_metrics (user_id, recorded_at, weight_kg)
+                   ''')
+    # Every profile save that sets a new weight appends to the history in the same statement
+    cursor.execute('''
+                   CREATE TRIGGER IF NOT EXISTS trg_profile_weight_insert
+                       AFTER INSERT ON health_profiles
+                       WHEN NEW.weight_kg IS NOT NULL
+                   BEGIN
+                       INSERT INTO body_metrics (user_id, weight_kg) VALUES (NEW.user_id, NEW.weight_kg);
+                   END
+                   ''')
+    cursor.execute('''
+                   CREATE TRIGGER IF NOT EXISTS trg_profile_weight_update
+                       AFTER UPDATE OF weight_kg ON health_profiles
+                       WHEN NEW.weight_kg IS NOT NULL AND NEW.weight_kg IS NOT OLD.weight_kg
+                   BEGIN
+                       INSERT INTO body_metrics (user_id, weight_kg) VALUES (NEW.user_id, NEW.weight_kg);
+                   END
+                   ''')
+    # Existing profiles start their history at their current weight
+    cursor.execute('''
+                   INSERT INTO body_metrics (user_id, weight_kg)
+                   SELECT user_id, weight_kg FROM health_profiles WHERE weight_kg IS NOT NULL
+                   ''')
+
+
+def _create_tdee_trends(cursor):
+    # Running weight-trend state per user for adaptive_tdee.py; one row per user
+    cursor.execute('''
+                   CREATE TABLE IF NOT EXISTS tdee_trends
+                   (
+                       user_id           INTEGER PRIMARY KEY REFERENCES users (id),
+                       trend_kg          REAL    NOT NULL,
+                       slope_kg_per_day  REAL    NOT NULL,
+                       intake_kcal       REAL    NOT NULL,
+                       tdee_kcal         REAL,
+                       samples           INTEGER NOT NULL,
+                       first_recorded_at TEXT    NOT NULL,
+                       last_recorded_at  TEXT    NOT NULL,
+                       last_metric_id    INTEGER NOT NULL
+                   )
+                   ''')
+
+
+def _reset_tdee_trends(cursor):
+    # Trends folded before intake was taken from the formula target fed their own
+    # estimate back in; dropping them makes the next refresh rebuild each one from
+    # the user's full weight history
+    cursor.execute("DELETE FROM tdee_trends")
+
+
+MIGRATIONS = [
+    (1, _create_base_tables),
+    (2, _add_profile_condition_columns),
+    (3, _create_body_metrics),
+    (4, _create_tdee_trends),
+    (5, _reset_tdee_trends),
+]
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """Applies every pending migration and returns the resulting schema version."""
+    current = schema_version(conn)
+    for version, apply in MIGRATIONS:
+        if version <= current:
+            continue
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            # Another process may have migrated while we waited for the write lock
+            if schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            apply(cursor)
+            cursor.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        current = version
+    return schema_version(conn)
@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import OrderedDict
+
+PLAN_CACHE_SIZE = 512
+PLAN_CACHE_TTL = 6 * 60 * 60  # seconds
+
+
+def plan_key(profile, sex=None, tdee=None):
+    """
+    Tuple of the HealthProfile fields generate_health_plan reads (all but user_id,
+    so users with identical inputs share a plan), the user's sex and adaptive TDEE.
+    """
+    return (
+        profile.fitness_goal,
+        profile.weight_kg,
+        profile.height_ft,
+        profile.height_in,
+        profile.age,
+        profile.activity_level,
+        profile.dietary_preference,
+        profile.physical_injury,
+        profile.medical_illness,
+        sex,
+        tdee,
+    )
+
+
+class PlanCache:
+    """Thread-safe LRU cache with a per-entry TTL. Cached plans must be treated as read-only."""
+
+    def __init__(self, max_size=PLAN_CACHE_SIZE, ttl=PLAN_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, plan)
+        # user_id -> the key of their cached plan, and its reverse (users can share a
+        # key); both only hold keys that are in _entries, so they stay bounded too
+        self._keys_by_user = {}
+        self._users_by_key = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, plan, user_id=None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, plan)
+            self._entries.move_to_end(key)
+            if user_id is not None:
+                previous = self._keys_by_user.get(user_id)
+                if previous is not None and previous != key:
+                    self._users_by_key[previous].discard(user_id)
+                self._keys_by_user[user_id] = key
+                self._users_by_key.setdefault(key, set()).add(user_id)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        # Drops an entry and every user index pointing at it; the caller holds the lock
+        del self._entries[key]
+        for user_id in self._users_by_key.pop(key, ()):
+            del self._keys_by_user[user_id]
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            key = self._keys_by_user.get(user_id)
+            if key is not None:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+            self._users_by_key.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# --- Process-wide cache shared by every Streamlit session ---
+_cache = PlanCache()
+
+
+def get_or_build(profile, build, sex=None, key=None, tdee=None):
+    # Callers that already hold the profile's plan_key can pass it to skip recomputing it
+    if key is None:
+        key = plan_key(profile, sex, tdee)
+    plan = _cache.get(key)
+    if plan is None:
+        plan = build(profile, sex, tdee)
+        _cache.put(key, plan, user_id=profile.user_id)
+    return plan
+
+
+def invalidate_user(user_id):
+    _cache.invalidate_user(user_id)
+
+
+def stats():
+    return _cache.stats()
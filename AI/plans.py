@@ -0,0 +1,211 @@
+import json
+import math
+import os
+from collections import namedtuple
+from string import Template
+
+from shared import conditions, injuries, nutrition
+
+# Plan content lives in plan_content/ as data files. The catalogue is loaded once
+# when this module is first imported and turned into immutable records; text with
+# numeric slots (e.g. $calories) is precompiled to string.Template.
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plan_content')
+
+# --- Plan records (lightweight, immutable and JSON-friendly via plan_to_dict) ---
+Note = namedtuple('Note', ['label', 'text'])
+Exercise = namedtuple('Exercise', ['name', 'prescription'])
+WorkoutDay = namedtuple('WorkoutDay', ['title', 'exercises'])
+WorkoutPlan = namedtuple('WorkoutPlan', ['notes', 'days'])
+Meal = namedtuple('Meal', ['title', 'ingredients', 'calories', 'protein_g', 'fat_g', 'carbs_g'])
+DietPlan = namedtuple('DietPlan', ['title', 'summary', 'guidelines', 'meals'])
+HealthPlan = namedtuple('HealthPlan', ['goal', 'calories', 'nutrition', 'workout', 'diet', 'health_warning'])
+
+
+def _compile(text):
+    return Template(text) if '$' in text else text
+
+
+def _fill(text, slots):
+    return text.substitute(slots) if isinstance(text, Template) else text
+
+
+def _load_json(name, content_dir):
+    with open(os.path.join(content_dir, name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_catalogue(content_dir=CONTENT_DIR):
+    catalogue = _load_json('catalogue.json', content_dir)
+
+    workouts = {
+        name: WorkoutPlan(
+            notes=tuple(Note(label, _compile(text)) for label, text in spec['notes']),
+            days=tuple(
+                WorkoutDay(day['title'], tuple(Exercise(*exercise) for exercise in day['exercises']))
+                for day in spec['days']
+            ),
+        )
+        for name, spec in _load_json('workouts.json', content_dir).items()
+    }
+    diets = {
+        name: DietPlan(
+            title=_compile(spec['title']),
+            summary=_compile(spec['summary']),
+            guidelines=tuple(Note(*guideline) for guideline in spec['guidelines']),
+            meals=tuple(Meal(**meal) for meal in spec['meals']),
+        )
+        for name, spec in _load_json('diets.json', content_dir).items()
+    }
+    return catalogue, workouts, diets
+
+
+CATALOGUE, WORKOUTS, DIETS = _load_catalogue()
+GOALS = CATALOGUE['goals']
+DEFAULT_GOAL = GOALS[CATALOGUE['default_goal']]
+
+
+def health_warning(physical_injury, medical_illness, recognised=()):
+    """`recognised` are the shared.conditions Conditions found in the notes; each adds its own precautions."""
+    if not (physical_injury or medical_illness):
+        return "No specific health concerns reported. Please proceed with your plan as outlined."
+
+    warning_message = "### **Important Health Warning**\n\n"
+    warning_message += "Your health plan has been generated based on the information provided, but your reported conditions require caution.\n\n"
+    if physical_injury:
+        warning_message += f"- **Physical Injury:** You reported having **{physical_injury}**. Please consult a medical professional or physical therapist before starting any new exercise routine. Avoid exercises that cause pain or discomfort.\n"
+    if medical_illness:
+        warning_message += f"- **Medical Illness:** You reported having **{medical_illness}**. It is crucial to consult your doctor before making any significant changes to your diet or exercise routine. They can provide guidance to ensure your plan is safe and effective for your specific condition.\n"
+    for condition in recognised:
+        warning_message += f"- **{condition.label}:** {condition.warning}\n"
+    warning_message += "\n**Always listen to your body and prioritize safety.**"
+    return warning_message
+
+
+def generate_health_plan(profile, sex=None, tdee=None):
+    """
+    Generates a goal-specific plan:
+    - Lose Weight: Calorie deficit, higher cardio, moderate strength.
+    - Gain Muscle: Fixed 3000 kcal (TDEE + 300 when adaptive), detailed 4-Day Split,
+      6-meal macro plan scaled to the targets.
+    - Improve Endurance: Maintenance calories, high cardio/endurance focus.
+    - Maintain Fitness: Maintenance calories, balanced workout.
+    `profile` is a HealthProfile. Unknown goals fall back to Maintain Fitness.
+    Calories and macros come from nutrition.calculate_targets using the user's sex
+    when it is known, and the adaptive `tdee` from logged weights when there is one.
+    Conditions recognised in the injury/illness notes add diet guidelines, exercise
+    exclusions and warnings.
+    """
+    goal = profile.fitness_goal
+    goal_spec = GOALS.get(goal, DEFAULT_GOAL)
+
+    targets = nutrition.calculate_targets(
+        profile.weight_kg, nutrition.height_to_cm(profile.height_ft, profile.height_in), profile.age,
+        profile.activity_level, goal, sex, adaptive_tdee=tdee,
+    )
+    slots = {
+        'calories': targets.calories,
+        'protein_g': targets.protein_g,
+        'fat_g': targets.fat_g,
+        'carbs_g': targets.carbs_g,
+    }
+
+    recognised = conditions.match(profile.medical_illness, profile.physical_injury)
+    workout = adapt_workout(WORKOUTS[goal_spec['workout']], profile.physical_injury, recognised)
+    diet_names = goal_spec['diet']
+    diet = DIETS[diet_names.get(profile.dietary_preference, diet_names['default'])]
+    if diet.meals and tuple(meal_totals(diet.meals))[2:] != tuple(targets)[2:]:
+        diet = scale_meals(diet, targets)
+    if recognised:
+        diet = diet._replace(guidelines=diet.guidelines + tuple(Note(c.label, c.diet) for c in recognised))
+
+    return HealthPlan(
+        goal=goal,
+        calories=targets.calories,
+        nutrition=targets,
+        workout=workout._replace(notes=tuple(Note(note.label, _fill(note.text, slots)) for note in workout.notes)),
+        diet=diet._replace(title=_fill(diet.title, slots), summary=_fill(diet.summary, slots)),
+        health_warning=health_warning(profile.physical_injury, profile.medical_illness, recognised),
+    )
+
+
+def adapt_workout(workout, physical_injury, recognised=()):
+    """
+    Swaps exercises that load an injured region, or that a recognised condition
+    rules out, for safer substitutes (see shared/injuries.py) and lists the changes
+    in an extra note. Prescriptions are kept; an exercise with no safe substitute
+    is dropped.
+    """
+    regions = injuries.regions_for(physical_injury)
+    excluded = conditions.excluded_exercises(recognised)
+    if not (regions or excluded):
+        return workout
+    days, changes = [], []
+    for day in workout.days:
+        _, substitutions = injuries.adapt_exercises([exercise.name for exercise in day.exercises], regions, excluded)
+        if not substitutions:
+            days.append(day)
+            continue
+        replacements = dict(substitutions)
+        exercises = tuple(
+            Exercise(replacements.get(exercise.name, exercise.name), exercise.prescription)
+            for exercise in day.exercises
+            if replacements.get(exercise.name, exercise.name) is not None
+        )
+        days.append(day._replace(exercises=exercises))
+        changes.extend(substitutions)
+    if not changes:
+        return workout
+    summary = "; ".join(
+        f"{change.original} → {change.replacement}" if change.replacement else f"{change.original} removed"
+        for change in dict.fromkeys(changes)
+    )
+    reasons = [f"{', '.join(sorted(regions)).replace('_', ' ')} injury"] if regions else []
+    reasons += [condition.label for condition in recognised if condition.avoid]
+    note = Note("Health Adjustments", f"Adapted for your reported {' and '.join(reasons)}: {summary}.")
+    return workout._replace(notes=workout.notes + (note,), days=tuple(days))
+
+
+def meal_totals(meals):
+    return Meal(
+        title="Daily Total",
+        ingredients="",
+        calories=sum(meal.calories for meal in meals),
+        protein_g=sum(meal.protein_g for meal in meals),
+        fat_g=sum(meal.fat_g for meal in meals),
+        carbs_g=sum(meal.carbs_g for meal in meals),
+    )
+
+
+def scale_meals(diet, targets):
+    """
+    The meal list is written for fixed daily totals (Gain Muscle's 3000 kcal). When
+    the targets differ, e.g. from an adaptive TDEE, each meal's calories and macros
+    are scaled so the daily total equals the targets exactly (rounded by largest
+    remainder), and a note says how far to resize the portions.
+    """
+    total = meal_totals(diet.meals)
+    scaled = {}
+    for field in ('calories', 'protein_g', 'fat_g', 'carbs_g'):
+        target = getattr(targets, field)
+        exact = [getattr(meal, field) * target / getattr(total, field) for meal in diet.meals]
+        amounts = [math.floor(amount) for amount in exact]
+        by_remainder = sorted(range(len(exact)), key=lambda i: exact[i] - amounts[i], reverse=True)
+        for i in by_remainder[:target - sum(amounts)]:
+            amounts[i] += 1
+        scaled[field] = amounts
+    meals = tuple(
+        meal._replace(**{field: amounts[i] for field, amounts in scaled.items()})
+        for i, meal in enumerate(diet.meals)
+    )
+    note = Note("Portions", f"These meals are scaled to your {targets.calories} kcal target: make each portion "
+                            f"about {targets.calories / total.calories:.0%} of the amounts listed.")
+    return diet._replace(meals=meals, guidelines=diet.guidelines + (note,))
+
+
+def plan_to_dict(value):
+    """Converts a plan (or any nested plan record) into plain dicts/lists for JSON output."""
+    if hasattr(value, '_asdict'):
+        return {field: plan_to_dict(item) for field, item in value._asdict().items()}
+    if isinstance(value, tuple):
+        return [plan_to_dict(item) for item in value]
+    return value
@@ -0,0 +1,58 @@
+import streamlit as st
+
+import adaptive_tdee
+import body_metrics
+import plan_cache
+import users
+
+# The logged-in user's id, sex, health profile row, adaptive TDEE and plan key (plus
+# any weight history charted so far), kept in st.session_state so page navigations read them
+# without touching the database. Filled once at login; the profile pages replace
+# the row after each write.
+SESSION_KEY = 'profile_cache'
+
+
+class SessionProfile:
+    __slots__ = ('user_id', 'sex', 'profile', 'tdee', 'plan_key', '_weight_history')
+
+    def __init__(self, user_id, sex, profile):
+        self.user_id = user_id
+        self.sex = sex
+        self.set_profile(profile)
+
+    def set_profile(self, profile):
+        self.profile = profile
+        # Folds in any weights logged since the last refresh; None until there is enough history
+        self.tdee = adaptive_tdee.refresh(self.user_id, profile, self.sex) if profile else None
+        self.plan_key = plan_cache.plan_key(profile, self.sex, self.tdee) if profile else None
+        # A save may have appended a weight, so charted history is re-read on demand
+        self._weight_history = {}
+
+    def weight_history(self, bucket):
+        if bucket not in self._weight_history:
+            self._weight_history[bucket] = body_metrics.weight_history(self.user_id, bucket)
+        return self._weight_history[bucket]
+
+
+def load(username):
+    """Reads the user and their profile (if any) into the session; called at login."""
+    user = users.get_user(username)
+    if user is None:
+        clear()
+        return None
+    user_id, sex = user
+    entry = SessionProfile(user_id, sex, users.get_health_profile(user_id))
+    st.session_state[SESSION_KEY] = entry
+    return entry
+
+
+def current():
+    """The cached entry for the logged-in user, loading it if this session has none yet."""
+    entry = st.session_state.get(SESSION_KEY)
+    if entry is None and st.session_state.get('username'):
+        entry = load(st.session_state.username)
+    return entry
+
+
+def clear():
+    st.session_state.pop(SESSION_KEY, None)
@@ -0,0 +1,47 @@
+# Static page fragments, built once per process. This module is imported (not
+# re-executed) by the Streamlit script, so reruns reuse these strings as-is; page
+# functions only send the dynamic parts on top of them.
+
+# The stylesheet is served from static/app.css (see .streamlit/config.toml), so each
+# rerun pushes a one-line link instead of the full CSS block.
+STYLESHEET = '<link rel="stylesheet" href="app/static/app.css">'
+
+HEADER_HTML = '<div class="header"><h1>AI-Fitness Assistant</h1></div>'
+
+FOOTER_HTML = """
+<div style="display: flex; justify-content: center; align-items: center; padding: 10px 0; font-size: 12px;">
+    <a href="#" onclick="parent.window.document.querySelector('[data-testid=stVerticalBlock] button[title=\\'About\\']').click(); return false;" class="footer-link">About Us</a>
+    <span style="margin: 0 10px; color: #555555;">|</span>
+    <a href="#" onclick="parent.window.document.querySelector('[data-testid=stVerticalBlock] button[title=\\'Contact\\']').click(); return false;" class="footer-link">Contact Us</a>
+    <span style="margin-left: 20px; color: #999999;">© 2025 AI-Fitness Assistant. All rights reserved.</span>
+</div>
+"""
+
+
+def _card(title, body):
+    return f'<div class="content-card"><h3>{title}</h3>{body}</div>'
+
+
+BLOG_POSTS = (
+    _card("The Importance of Consistency",
+         "<p>Consistency is paramount in achieving long-term success, as even small, consistent actions build the necessary momentum for progress and effectively prevent setbacks. This steady, repeated effort is what reinforces desired behaviors, ultimately solidifying them into sustainable habits. By ensuring reliable application of effort over time, consistency directly drives superior results, refining skills, and leading to genuine mastery in any endeavor.</p>"),
+    _card("Understanding Macronutrients",
+         "<p>Macronutrients—Carbohydrates, Proteins, and Fats—are the three essential components of food your body needs in large quantities for energy and overall health. Carbohydrates are the primary fuel source, broken down into glucose for energy. Protein acts as the body's structural material, vital for muscle repair, growth, and immune function. Fats are crucial for long-term energy storage, hormone regulation, and absorbing key vitamins. Understanding and balancing these three macros is fundamental to optimizing your nutrition and achieving your fitness and health objectives.</p>"),
+)
+
+ABOUT_CARDS = (
+    _card("Our Mission",
+         "<p>We are dedicated to democratizing personalized health. Our mission is to provide cutting-edge, **AI-driven fitness and nutrition plans** tailored to your unique profile, goals, and limitations. We believe everyone deserves access to expert guidance without the premium cost.</p>"),
+    _card("Why Choose AI-Fitness?", """
+<ul>
+    <li>**Personalized Plans:** Algorithms calculate your exact TDEE, macronutrients, and workout split based on your data.</li>
+    <li>**Safety First:** Built-in health warnings ensure you consult professionals regarding injuries or illnesses before training.</li>
+    <li>**Data Security:** Your profile and health data are secured using industry-standard hashing and database practices.</li>
+</ul>"""),
+)
+
+CONTACT_DETAILS_CARD = _card("Get in Touch", """
+<p>If you have any questions, require technical support, or need assistance with your fitness plan, please reach out to us using the details below or fill out the contact form.</p>
+<p><strong>General Support:</strong> support@ai-fitness-assistant.com</p>
+<p><strong>Technical Issues:</strong> tech@ai-fitness-assistant.com</p>
+<p><strong>Phone:</strong> +91 1234 567890 (M-F, 9 AM - 5 PM IST)</p>""")
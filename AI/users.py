@@ -0,0 +1,92 @@
+import sqlite3
+
+import db
+import hashing
+import plan_cache
+from health_profile import HealthProfile
+
+# --- Database functions (all access goes through the pooled connections in db.py) ---
+
+
+def register_user(username, contact, email, gender, address, password):
+    with db.connection() as conn:
+        cursor = conn.cursor()
+
+        # Check for uniqueness
+        cursor.execute("SELECT COUNT(*) FROM users WHERE username = ?", (username,))
+        if cursor.fetchone()[0] > 0:
+            raise ValueError("Username already exists.")
+
+        cursor.execute("SELECT COUNT(*) FROM users WHERE contact = ? OR email = ?", (contact, email))
+        if cursor.fetchone()[0] > 0:
+            raise ValueError("Contact or email already exists. Please use a different one.")
+
+    # Hash on the bcrypt worker pool without holding a pooled connection
+    hashed_password = hashing.hash_password(password)
+
+    try:
+        with db.connection() as conn:
+            conn.execute(
+                "INSERT INTO users (username, contact, email, gender, address, password_hash) VALUES (?, ?, ?, ?, ?, ?)",
+                (username, contact, email, gender, address, hashed_password))
+    except sqlite3.IntegrityError:
+        # Another registration with the same details won the race
+        raise ValueError("Username, contact or email already exists.")
+
+
+def login_user(username, password):
+    with db.connection() as conn:
+        result = conn.execute("SELECT password_hash FROM users WHERE username = ?", (username,)).fetchone()
+
+    if result:
+        stored_hash = result[0]
+        return hashing.check_password(password, stored_hash)
+
+    return False
+
+
+def get_user(username):
+    """Returns (id, gender) for `username`, or None."""
+    with db.connection() as conn:
+        return conn.execute("SELECT id, gender FROM users WHERE username = ?", (username,)).fetchone()
+
+
+def get_health_profile(user_id):
+    with db.connection() as conn:
+        row = conn.execute(
+            f"SELECT {HealthProfile.SELECT_LIST} FROM health_profiles WHERE user_id = ?", (user_id,)
+        ).fetchone()
+    return HealthProfile.from_row(row)
+
+
+def save_health_profile(user_id, age, height_ft, height_in, weight_kg, activity_level, fitness_goal,
+                        dietary_preference, physical_injury, medical_illness):
+    """
+    Creates or replaces the user's health profile in a single statement and returns
+    the stored HealthProfile, so concurrent first saves (e.g. two tabs) cannot collide.
+    """
+    with db.connection() as conn:
+        row = conn.execute(
+            f"""
+            INSERT INTO health_profiles (user_id, age, height_ft, height_in, weight_kg, activity_level, fitness_goal,
+                                         dietary_preference, physical_injury, medical_illness)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (user_id) DO UPDATE
+                SET age                = excluded.age,
+                    height_ft          = excluded.height_ft,
+                    height_in          = excluded.height_in,
+                    weight_kg          = excluded.weight_kg,
+                    activity_level     = excluded.activity_level,
+                    fitness_goal       = excluded.fitness_goal,
+                    dietary_preference = excluded.dietary_preference,
+                    physical_injury    = excluded.physical_injury,
+                    medical_illness    = excluded.medical_illness
+            RETURNING {HealthProfile.SELECT_LIST}
+            """,
+            (user_id, age, height_ft, height_in, weight_kg, activity_level, fitness_goal, dietary_preference,
+             physical_injury, medical_illness)
+        ).fetchone()
+    plan_cache.invalidate_user(user_id)
+    # HealthProfile coerces weight_kg to float: on SQLite 3.40 RETURNING reports the
+    # value before REAL affinity is applied, so a whole number comes back as an int
+    return HealthProfile.from_row(row)
@@ -0,0 +1,34 @@
+import importlib
+
+# Page name -> (module in this package, render function). Modules are imported the
+# first time their page is shown, so e.g. the plan catalogue is only loaded once
+# someone opens the health plan.
+PUBLIC_PAGES = {
+    'home': ('home', 'home_page'),
+    'register': ('register', 'register_page'),
+    'login': ('login', 'login_page'),
+    'about': ('about', 'about_page'),
+    'contact': ('contact', 'contact_page'),
+}
+MEMBER_PAGES = {
+    'profile_page': ('profile', 'profile_page'),
+    'edit_profile': ('edit_profile', 'edit_profile_page'),
+    'health_plan': ('health_plan', 'health_plan_page'),
+    'about': ('about', 'about_page'),
+    'contact': ('contact', 'contact_page'),
+}
+# Unknown (or, when logged out, restricted) page names fall back to these
+PUBLIC_DEFAULT = 'home'
+MEMBER_DEFAULT = 'profile_page'
+
+
+def resolve(page_name, logged_in):
+    """Returns the render function for `page_name`, importing its module on first use."""
+    registry, default = (MEMBER_PAGES, MEMBER_DEFAULT) if logged_in else (PUBLIC_PAGES, PUBLIC_DEFAULT)
+    module_name, function_name = registry.get(page_name) or registry[default]
+    module = importlib.import_module(f'{__name__}.{module_name}')
+    return getattr(module, function_name)
+
+
+def render(page_name, logged_in):
+    resolve(page_name, logged_in)()
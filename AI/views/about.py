@@ -0,0 +1,19 @@
+import streamlit as st
+
+import static_content
+from layout import set_page, show_header, show_footer
+
+
+def about_page():
+    show_header()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f'<h2 style="color:#00ff99;">About AI-Fitness Assistant</h2>', unsafe_allow_html=True)
+
+        for about_card in static_content.ABOUT_CARDS:
+            st.markdown(about_card, unsafe_allow_html=True)
+
+        if st.button("Back to Home", key="back_about_page_btn", use_container_width=True):
+            set_page('home')
+
+    show_footer()
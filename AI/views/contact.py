@@ -0,0 +1,38 @@
+import streamlit as st
+
+import static_content
+from layout import set_page, show_header, show_footer
+
+
+def contact_page():
+    show_header()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f'<h2 style="color:#00ff99;">Contact Our Support Team</h2>', unsafe_allow_html=True)
+
+        st.markdown(static_content.CONTACT_DETAILS_CARD, unsafe_allow_html=True)
+
+        # Contact Form
+        st.markdown('<div class="content-card">', unsafe_allow_html=True)
+        st.subheader("Send Us a Message")
+        with st.form("contact_form"):
+            name = st.text_input("Your Name")
+            email = st.text_input("Your Email")
+            reason = st.selectbox("Reason for Contact",
+                                  ["Technical Support", "Billing Query", "General Inquiry", "Feature Suggestion"])
+            message = st.text_area("Your Message")
+
+            contact_submitted = st.form_submit_button("Submit Message")
+
+            if contact_submitted:
+                if name and email and message:
+                    # Placeholder for sending email/saving contact message
+                    st.success(f"Thank you, {name}! Your message regarding '{reason}' has been submitted.")
+                else:
+                    st.error("Please fill in all required fields (Name, Email, and Message).")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        if st.button("Back to Home", key="back_contact_page_btn", use_container_width=True):
+            set_page('home')
+
+    show_footer()
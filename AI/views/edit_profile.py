@@ -0,0 +1,89 @@
+import streamlit as st
+
+import profile_session
+import users
+from layout import set_page, show_header, show_footer
+
+
+def edit_profile_page():
+    # Sidebar navigation is shown by the main loop logic
+    show_header()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f'<h2 style="color:#00ff99;">Edit Your Health Profile</h2>', unsafe_allow_html=True)
+
+        entry = profile_session.current()
+        profile_data = entry.profile if entry else None
+
+        if profile_data:
+            user_id = entry.user_id
+            with st.form("edit_profile_form"):
+                current_age = profile_data.age
+                current_height_ft = profile_data.height_ft
+                current_height_in = profile_data.height_in
+                current_weight_kg = profile_data.weight_kg
+                current_activity_level = profile_data.activity_level
+                current_fitness_goal = profile_data.fitness_goal
+                current_dietary_preference = profile_data.dietary_preference
+                current_physical_injury = profile_data.physical_injury
+                current_medical_illness = profile_data.medical_illness
+
+                age = st.number_input("Age", min_value=1, max_value=120, step=1, value=current_age,
+                                      key="edit_age_input")
+                col_height_ft, col_height_in = st.columns(2)
+                with col_height_ft:
+                    height_ft = st.number_input("Height (feet)", min_value=0, max_value=8, step=1,
+                                                value=current_height_ft, key="edit_ft_input")
+                with col_height_in:
+                    height_in = st.number_input("Height (inches)", min_value=0, max_value=11, step=1,
+                                                value=current_height_in, key="edit_in_input")
+
+                weight_kg = st.number_input("Weight (kg)", min_value=1.0, max_value=500.0, step=0.1,
+                                            value=current_weight_kg, key="edit_weight_input")
+
+                activity_levels = ["Sedentary", "Lightly Active", "Moderately Active", "Very Active", "Super Active"]
+                activity_index = activity_levels.index(
+                    current_activity_level) if current_activity_level in activity_levels else 0
+                activity_level = st.selectbox(
+                    "Your typical weekly activity level?",
+                    activity_levels,
+                    index=activity_index,
+                    key="edit_activity_input"
+                )
+
+                fitness_goals = ["Lose Weight", "Gain Muscle", "Improve Endurance", "Maintain Fitness"]
+                goal_index = fitness_goals.index(current_fitness_goal) if current_fitness_goal in fitness_goals else 0
+                fitness_goal = st.selectbox(
+                    "Your primary fitness goal?",
+                    fitness_goals,
+                    index=goal_index,
+                    key="edit_goal_input"
+                )
+
+                dietary_preferences = ["Vegetarian", "Non-Vegetarian"]
+                diet_index = dietary_preferences.index(
+                    current_dietary_preference) if current_dietary_preference in dietary_preferences else 0
+                dietary_preference = st.selectbox(
+                    "Your dietary preference?",
+                    dietary_preferences,
+                    index=diet_index,
+                    key="edit_diet_input"
+                )
+
+                physical_injury = st.text_area("Any physical injuries?", value=current_physical_injury,
+                                               key="edit_injury_input")
+                medical_illness = st.text_area("Any medical illnesses?", value=current_medical_illness,
+                                               key="edit_illness_input")
+
+                submitted = st.form_submit_button("Save Changes")
+                if submitted:
+                    entry.set_profile(users.save_health_profile(
+                        user_id, age, height_ft, height_in, weight_kg, activity_level, fitness_goal,
+                        dietary_preference, physical_injury, medical_illness))
+                    st.success("Your health profile has been updated successfully!")
+                    set_page('profile_page')
+
+        if st.button("Back to Profile", key="back_edit_page_btn", use_container_width=True):
+            set_page('profile_page')
+
+    show_footer()
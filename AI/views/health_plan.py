@@ -0,0 +1,88 @@
+import streamlit as st
+
+import plan_cache
+import plans
+import profile_session
+from layout import set_page, show_header, show_footer
+
+
+def show_workout_plan(workout):
+    st.markdown("\n\n".join(f"**{note.label}:** {note.text}" for note in workout.notes))
+    for day in workout.days:
+        st.markdown("---")
+        st.markdown(f"#### {day.title}")
+        if day.exercises:
+            st.markdown("\n".join(f"- **{exercise.name}:** {exercise.prescription}" for exercise in day.exercises))
+
+
+def show_diet_plan(diet):
+    st.markdown(f"**{diet.title}:** {diet.summary}")
+    if diet.guidelines:
+        st.markdown("\n".join(f"- **{guideline.label}:** {guideline.text}" for guideline in diet.guidelines))
+
+    # Meal-by-meal plans (e.g. Muscle Gain) are listed with their macros and a daily total
+    for meal in diet.meals:
+        st.markdown(f"**{meal.title}**")
+        st.markdown(
+            f"- **Ingredients:** {meal.ingredients}\n"
+            f"- **Approx. Macros:** **Calories:** {meal.calories} | **Protein:** {meal.protein_g}g | "
+            f"**Fat:** {meal.fat_g}g | **Carbs:** {meal.carbs_g}g"
+        )
+    if diet.meals:
+        total = plans.meal_totals(diet.meals)
+        st.markdown(
+            f"**DAILY TOTAL (Approx.):** **Calories:** {total.calories} | **Total Protein:** {total.protein_g}g | "
+            f"**Total Fat:** {total.fat_g}g | **Total Carbs:** {total.carbs_g}g"
+        )
+
+
+def health_plan_page():
+    # Sidebar navigation is shown by the main loop logic
+    show_header()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f'<h2 style="color:#00ff99;">Your Personalized Health Plan</h2>', unsafe_allow_html=True)
+
+        entry = profile_session.current()
+        if entry and entry.profile:
+            plan = plan_cache.get_or_build(entry.profile, plans.generate_health_plan, sex=entry.sex,
+                                           key=entry.plan_key, tdee=entry.tdee)
+
+            # --- Overview Metrics ---
+            st.markdown('<div class="content-card">', unsafe_allow_html=True)
+            st.subheader("Plan Summary")
+            col_goal, col_cal = st.columns(2)
+            col_goal.metric("Goal", plan.goal)
+            col_cal.metric("Daily Calories", f"{plan.calories} kcal")
+            col_protein, col_carbs, col_fat = st.columns(3)
+            col_protein.metric("Protein", f"{plan.nutrition.protein_g} g")
+            col_carbs.metric("Carbs", f"{plan.nutrition.carbs_g} g")
+            col_fat.metric("Fat", f"{plan.nutrition.fat_g} g")
+            if entry.tdee is not None:
+                st.caption(f"Calories are based on your logged weight trend (estimated TDEE {entry.tdee} kcal).")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # --- Workout Plan ---
+            st.markdown('<div class="content-card">', unsafe_allow_html=True)
+            st.subheader("🏋️ Detailed Workout Plan")
+            show_workout_plan(plan.workout)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # --- Dietary Plan ---
+            st.markdown('<div class="content-card">', unsafe_allow_html=True)
+            st.subheader("🍎 Dietary Recommendations")
+            show_diet_plan(plan.diet)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # --- Health Warning (Explicitly styled via CSS) ---
+            st.error(plan.health_warning)
+
+        else:
+            st.warning("Please complete your health profile first.")
+            if st.button("Go to Profile Page", key="plan_to_profile_btn", use_container_width=True):
+                set_page('profile_page')
+
+        if st.button("Back to Profile", key="back_to_profile_btn", use_container_width=True):
+            set_page('profile_page')
+
+    show_footer()
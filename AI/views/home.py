@@ -0,0 +1,48 @@
+import streamlit as st
+
+import images
+import static_content
+from layout import set_page, show_header, show_footer, HERO_IMAGE_WIDTH
+
+
+def home_page():
+    # The home page remains standard but adopts the new dark theme
+    show_header()
+
+    # Hero section with large, contrasting elements
+    st.markdown('<div class="content-card">', unsafe_allow_html=True)
+    # FIRST IMAGE TAG: Gym and fitness related photo
+    st.image(images.variant("AI.jpg", HERO_IMAGE_WIDTH),
+             caption="Achieve your fitness goals with AI.",
+             use_container_width=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # Title and buttons section
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f'<h2 style="color:#f0f0f0; font-weight: 600;">Your Personal Health & Fitness Guide</h2>',
+                    unsafe_allow_html=True)
+        st.write("Get a personalized health plan based on your unique data and goals.")
+
+        # Centering the buttons
+        button_col1, button_col2, button_col3 = st.columns([1, 1, 1])
+        with button_col1:
+            reg_button = st.button("Register", key="home_register_btn")
+        with button_col3:
+            login_button = st.button("Login", key="home_login_btn")
+
+    # The Logic for the buttons
+    if reg_button:
+        set_page('register')
+    if login_button:
+        set_page('login')
+
+    # Information Blog Section
+    st.markdown("---")
+    st.subheader("Fitness Blog")
+
+    for post in static_content.BLOG_POSTS:
+        st.markdown(post, unsafe_allow_html=True)
+
+    # Footer
+    show_footer()
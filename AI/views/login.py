@@ -0,0 +1,57 @@
+import streamlit as st
+
+import hashing
+import profile_session
+import users
+from layout import set_page, show_header, show_footer
+
+
+def login_page():
+    # Inject the HTML and CSS for the background only on this page
+    st.markdown('<div class="login-background"></div>', unsafe_allow_html=True)
+
+    show_header()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f'<h2 style="color:#f0f0f0;">Login to Your Account</h2>', unsafe_allow_html=True)
+
+        with st.form("login_form"):
+            login_username = st.text_input("Username", key="login_username")
+            login_password = st.text_input("Password", type="password", key="login_password")
+
+            # The Login button benefits from the new targeted CSS style applied globally to forms
+            submitted = st.form_submit_button("Login")
+
+            if submitted:
+                try:
+                    logged_in = users.login_user(login_username, login_password)
+                except hashing.HashingBusy as e:
+                    st.warning(str(e))
+                else:
+                    if logged_in:
+                        st.session_state.username = login_username
+                        profile_session.load(login_username)
+                        st.success(f"Welcome back, {login_username}!")
+                        set_page('profile_page')
+                    else:
+                        st.error("Invalid username or password.")
+
+        # --- Register button placed beside the question ---
+        col_text, col_button = st.columns([1, 1])
+        with col_text:
+            st.markdown(
+                """
+                <div style="text-align: right; margin-top: 20px;">
+                    <p style="margin: 0; font-size: 14px; color: #999999;">Don't have an account?</p>
+                </div>
+                """, unsafe_allow_html=True
+            )
+        with col_button:
+            if st.button("Register", key="reg_login_page_btn"):
+                set_page('register')
+        # -----------------------------------------------------------
+
+    if st.button("Back to Home", key="back_login_page_btn"):
+        set_page('home')
+
+    show_footer()
@@ -0,0 +1,139 @@
+import streamlit as st
+
+import profile_session
+import users
+from layout import set_page, show_header, show_footer, add_fitness_images
+
+
+def show_weight_history(entry):
+    # Past year of weights, downsampled in SQL and cached per session (see profile_session.py)
+    st.markdown('<div class="content-card">', unsafe_allow_html=True)
+    st.subheader("Weight History")
+    bucket = st.radio("Group by", ["day", "week", "month"], index=1, horizontal=True,
+                      format_func=str.capitalize, key="profile_weight_bucket")
+    history = entry.weight_history(bucket)
+    if len(history) > 1:
+        st.line_chart({
+            "Period": [point.period for point in history],
+            "Weight (kg)": [round(point.avg_kg, 1) for point in history],
+        }, x="Period", y="Weight (kg)")
+    else:
+        st.write("Update your weight from Edit Profile to start charting your progress.")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def profile_page():
+    # Sidebar navigation is shown by the main loop logic
+
+    show_header()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f'<h2 style="color:#00ff99;">Your Health Profile</h2>', unsafe_allow_html=True)
+
+        entry = profile_session.current()
+        if entry:
+            user_id = entry.user_id
+            profile_data = entry.profile
+
+            if profile_data:
+                st.markdown('<div class="content-card">', unsafe_allow_html=True)
+                st.subheader("Current Profile Snapshot")
+
+                # --- Simplified Data Display ---
+                col_info1, col_info2, col_info3 = st.columns(3)
+
+                # Row 1: Key Metrics (Metrics are simple and high-contrast)
+                col_info1.metric("Goal", profile_data.fitness_goal)
+                col_info2.metric("Weight (kg)", f"{profile_data.weight_kg}")
+                col_info3.metric("Age (years)", f"{profile_data.age}")
+
+                st.markdown("---")
+
+                # Row 2: Secondary Metrics/Status
+                st.markdown(f"**Height:** {profile_data.height_ft} ft, {profile_data.height_in} in")
+                st.markdown(f"**Activity Level:** {profile_data.activity_level}")
+                st.markdown(f"**Dietary Preference:** {profile_data.dietary_preference}")
+
+                # Row 3: Warnings/Special Conditions (use markdown for direct visibility)
+                if profile_data.physical_injury or profile_data.medical_illness:
+                    st.markdown("---")
+                    st.markdown(f"⚠️ **Injuries/Illness Reported:**")
+                    if profile_data.physical_injury:
+                        st.markdown(f"- **Injury:** {profile_data.physical_injury}")
+                    if profile_data.medical_illness:
+                        st.markdown(f"- **Illness:** {profile_data.medical_illness}")
+
+                st.markdown('</div>', unsafe_allow_html=True)
+
+                show_weight_history(entry)
+
+                # --- ADDED FITNESS IMAGES SECTION (FIXED) ---
+                add_fitness_images()
+                # ------------------------------------
+
+                # --- Action Buttons ---
+                col_edit, col_plan = st.columns(2)
+                with col_edit:
+                    if st.button("Edit Profile Data", key="profile_edit_btn", use_container_width=True):
+                        set_page('edit_profile')
+                with col_plan:
+                    if st.button("Generate Health Plan", key="profile_get_plan_btn", use_container_width=True):
+                        set_page('health_plan')
+
+            else:
+                # --- Complete Profile Form (Unchanged) ---
+                st.markdown('<div class="content-card">', unsafe_allow_html=True)
+                st.subheader("Complete Your Health Profile")
+                st.write("Please provide the following information to receive a personalized health plan.")
+
+                with st.form("health_profile_form"):
+                    age = st.number_input("Age", min_value=1, max_value=120, step=1, key="profile_age_input")
+                    col_height_ft, col_height_in = st.columns(2)
+                    with col_height_ft:
+                        height_ft = st.number_input("Height (feet)", min_value=0, max_value=8, step=1,
+                                                    key="profile_ft_input")
+                    with col_height_in:
+                        height_in = st.number_input("Height (inches)", min_value=0, max_value=11, step=1,
+                                                    key="profile_in_input")
+
+                    weight_kg = st.number_input("Weight (kg)", min_value=1.0, max_value=500.0, step=0.1,
+                                                key="profile_weight_input")
+
+                    activity_level = st.selectbox(
+                        "Your typical weekly activity level?",
+                        ["Select Level", "Sedentary", "Lightly Active", "Moderately Active", "Very Active",
+                         "Super Active"],
+                        key="profile_activity_input"
+                    )
+
+                    fitness_goal = st.selectbox(
+                        "Your primary fitness goal?",
+                        ["Select Goal", "Lose Weight", "Gain Muscle", "Improve Endurance", "Maintain Fitness"],
+                        key="profile_goal_input"
+                    )
+
+                    dietary_preference = st.selectbox(
+                        "Your dietary preference?",
+                        ["Select Preference", "Vegetarian", "Non-Vegetarian"],
+                        key="profile_diet_input"
+                    )
+
+                    physical_injury = st.text_area("Any physical injuries? (e.g., knee pain, shoulder injury)",
+                                                   key="profile_injury_input")
+                    medical_illness = st.text_area("Any medical illnesses? (e.g., high blood pressure, diabetes)",
+                                                   key="profile_illness_input")
+
+                    submitted = st.form_submit_button("Save Profile")
+
+                    if submitted:
+                        if age and height_ft and height_in and weight_kg and activity_level != "Select Level" and fitness_goal != "Select Goal" and dietary_preference != "Select Preference":
+                            entry.set_profile(users.save_health_profile(
+                                user_id, age, height_ft, height_in, weight_kg, activity_level, fitness_goal,
+                                dietary_preference, physical_injury, medical_illness))
+                            st.success("Your health profile has been saved successfully!")
+                            st.experimental_rerun()  # Rerun to show the saved data
+                        else:
+                            st.error("Please fill in all the fields.")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+    show_footer()
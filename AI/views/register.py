@@ -0,0 +1,49 @@
+import streamlit as st
+
+import hashing
+import users
+from layout import set_page, show_header, show_footer
+from shared.validation import validate_signup
+
+
+def register_page():
+    show_header()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(f'<h2 style="color:#f0f0f0;">Create Your Account</h2>', unsafe_allow_html=True)
+
+        with st.form("registration_form"):
+            # Form elements remain functional, inheriting new input styling
+            username = st.text_input("Username", key="reg_username")
+            contact = st.text_input("Contact Number", key="reg_contact")
+            email = st.text_input("Email", key="reg_email")
+            gender = st.selectbox("Gender", ["Select Gender", "Male", "Female", "Other"], key="reg_gender")
+            address = st.text_area("Address", key="reg_address")
+            password = st.text_input("Password", type="password", key="reg_password")
+            re_password = st.text_input("Re-enter Password", type="password", key="reg_re_password")
+
+            submitted = st.form_submit_button("Register")
+
+            if submitted:
+                errors = validate_signup({
+                    'username': username, 'contact': contact, 'email': email,
+                    'gender': '' if gender == "Select Gender" else gender, 'address': address,
+                    'password': password, 're_password': re_password,
+                })
+                if errors:
+                    for error in errors:
+                        st.error(error)
+                else:
+                    try:
+                        users.register_user(username, contact, email, gender, address, password)
+                        st.success("Registration successful! You can now log in.")
+                        set_page('login')
+                    except ValueError as e:
+                        st.error(str(e))
+                    except hashing.HashingBusy as e:
+                        st.warning(str(e))
+
+    if st.button("Back to Home", key="back_reg_page_btn"):
+        set_page('home')
+
+    show_footer()
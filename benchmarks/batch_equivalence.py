@@ -0,0 +1,82 @@
+"""
+Checks that the vectorized batch path (AI/batch.py) gives exactly what the scalar
+path gives: for random profiles, including unknown goals, activity levels and
+sexes, and with an adaptive TDEE for some of them, every plan id, TDEE, calorie
+and macro target from batch.nutrition_targets must equal the one
+generate_health_plan computes. Exits with status 1 and lists the first
+mismatches otherwise.
+
+    python benchmarks/batch_equivalence.py [profiles] [seed]
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'AI'), ROOT]
+import batch
+from health_profile import HealthProfile
+from plans import generate_health_plan
+from shared import nutrition
+
+FIELDS = ('plan_id', 'tdee', 'calories', 'protein_g', 'fat_g', 'carbs_g')
+GOALS = batch.GOAL_NAMES + ('Get Fit', '')
+ACTIVITY_LEVELS = batch.ACTIVITY_NAMES + ('Couch Potato',)
+SEXES = batch.SEX_NAMES + ('Other', None)
+SHOWN = 10
+
+
+def random_profiles(count, seed):
+    """
+    HealthProfiles without condition notes, with the sex each is planned for and a
+    stored tdee_trends.tdee_kcal (None for about a third, some exactly on a .5).
+    """
+    rng = random.Random(seed)
+    profiles, sexes, adaptive = [], [], []
+    for user_id in range(1, count + 1):
+        profiles.append(HealthProfile.from_row((
+            user_id, rng.randint(13, 90), rng.randint(4, 7), rng.randint(0, 11), round(rng.uniform(35, 180), 1),
+            rng.choice(ACTIVITY_LEVELS), rng.choice(GOALS), '', '', '',
+        )))
+        sexes.append(rng.choice(SEXES))
+        adaptive.append(rng.choice((None, rng.uniform(1200, 4000), rng.randint(1200, 4000) + 0.5)))
+    return profiles, sexes, adaptive
+
+
+def scalar_targets(profile, sex, tdee_kcal):
+    # Rounded like adaptive_tdee.estimate, as export_plans does for the stored value
+    plan = generate_health_plan(profile, sex, None if tdee_kcal is None else int(round(tdee_kcal)))
+    goal = nutrition.normalise_keys(plan.goal, profile.activity_level, sex)[0]
+    return (batch.GOAL_NAMES.index(goal),) + tuple(plan.nutrition)[1:]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 42
+    profiles, sexes, adaptive = random_profiles(count, seed)
+
+    start = time.perf_counter()
+    expected = [scalar_targets(*args) for args in zip(profiles, sexes, adaptive)]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    targets = batch.nutrition_targets(
+        [p.age for p in profiles], [p.height_ft for p in profiles], [p.height_in for p in profiles],
+        [p.weight_kg for p in profiles], [p.activity_level for p in profiles],
+        [p.fitness_goal for p in profiles], sexes, adaptive,
+    )
+    batch_seconds = time.perf_counter() - start
+    actual = list(zip(*(targets[field].tolist() for field in FIELDS)))
+
+    mismatches = [(p, sex, want, got) for p, sex, want, got in zip(profiles, sexes, expected, actual) if want != got]
+    print(f"{count} profiles: scalar {scalar_seconds:.2f}s, batch {batch_seconds:.3f}s, "
+          f"{len(mismatches)} mismatches")
+    for profile, sex, want, got in mismatches[:SHOWN]:
+        print(f"  user {profile.user_id} ({sex}): scalar {dict(zip(FIELDS, want))} batch {dict(zip(FIELDS, got))}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
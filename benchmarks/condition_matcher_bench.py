@@ -0,0 +1,90 @@
+"""
+Throughput of condition normalisation over a synthetic corpus of profile notes:
+a per-synonym substring scan and a single regex alternation against the
+Aho-Corasick PhraseMatcher behind shared.conditions.match. Results are checked
+before timing; the regex reports one synonym per position, so it can miss a
+synonym nested in a longer one ('diabetes' in 'diabetes type 1').
+
+    python benchmarks/condition_matcher_bench.py [texts] [seed]
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.conditions import MATCHER, SYNONYMS
+from shared.phrase_matcher import words
+
+FILLER = (
+    "i have had for years mild some occasional since childhood controlled with medication my doctor says "
+    "none no known issues recently diagnosed family history of borderline managed through diet and also"
+).split()
+
+
+def build_corpus(count, seed):
+    """Profile notes of 0-3 conditions, written with random casing and punctuation, among filler words."""
+    rng = random.Random(seed)
+    synonyms = list(SYNONYMS)
+    corpus = []
+    for _ in range(count):
+        words = rng.choices(FILLER, k=rng.randint(3, 25))
+        for _ in range(rng.choice((0, 1, 1, 2, 3))):
+            synonym = rng.choice(synonyms)
+            synonym = synonym.upper() if rng.random() < 0.2 else synonym.replace(' ', rng.choice((' ', '-')))
+            words.insert(rng.randrange(len(words) + 1), synonym)
+        corpus.append(rng.choice((', ', ' ', '; ')).join(words))
+    return corpus
+
+
+def padded(text):
+    return f" {' '.join(words(text))} "
+
+
+def substring_scan(text):
+    text = padded(text)
+    return frozenset(key for synonym, key in SYNONYMS.items() if f" {synonym} " in text)
+
+
+ALTERNATION = re.compile(
+    r"(?= (" + "|".join(re.escape(synonym) for synonym in sorted(SYNONYMS, key=len, reverse=True)) + r") )"
+)
+
+
+def regex_alternation(text):
+    # The lookahead lets matches overlap on their shared padding space
+    return frozenset(SYNONYMS[synonym] for synonym in ALTERNATION.findall(padded(text)))
+
+
+def throughput(func, corpus):
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for text in corpus:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return len(corpus) / best, sum(map(len, corpus)) / best / 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 42
+    corpus = build_corpus(count, seed)
+    for text in corpus[:2000]:
+        expected = substring_scan(text)
+        assert MATCHER.find(text) == expected and regex_alternation(text) <= expected, text
+
+    print(f"{len(corpus)} texts, {sum(map(len, corpus)) / 1e6:.1f} MB, {len(SYNONYMS)} synonyms")
+    print(f"{'matcher':<28}{'texts/s':>12}{'MB/s':>8}")
+    for label, func in (
+        ('substring scan', substring_scan),
+        ('regex alternation', regex_alternation),
+        ('PhraseMatcher (trie)', MATCHER.find),
+    ):
+        texts_per_second, mb_per_second = throughput(func, corpus)
+        print(f"{label:<28}{texts_per_second:>12,.0f}{mb_per_second:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
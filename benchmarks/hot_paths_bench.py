@@ -0,0 +1,353 @@
+"""
+Latency percentiles and throughput of the hot paths in both apps, against
+temporary SQLite databases seeded with synthetic users and profiles:
+
+    ai.login_user, ai.get_health_profile, ai.generate_health_plan, flask.signup
+
+Each dataset size gets its own freshly seeded database; the same --seed gives the
+same data. Results are compared with the stored baseline (benchmarks/baselines/
+hot_paths.json) and the run exits with status 1 when a path's p50 is slower than
+that path's tolerance allows; the tail percentiles are reported but too noisy to
+gate on.
+
+--update-baseline measures everything --runs times and stores the median run.
+Each path's tolerance is twice the p50 spread seen across those runs, and never
+below TOLERANCE, or SUB_MS_TOLERANCE for sub-millisecond paths: their p50 drifts
+between sessions by more than a few back-to-back runs show, while the
+hashing-bound auth paths stay steady. --tolerance overrides every path's
+tolerance. Baselines are machine-specific: refresh them when the hardware
+changes or a slowdown is intended.
+
+    python benchmarks/hot_paths_bench.py [--sizes 1000,100000,1000000] [--seed N]
+                                         [--tolerance F] [--update-baseline [--runs N]]
+
+The two apps both have top-level modules named `migrations`, so each one is
+measured in its own subprocess (--app ai|flask) that prints its results as JSON.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baselines', 'hot_paths.json')
+APPS = ('ai', 'flask')
+DEFAULT_SIZES = (1000, 100000)
+TOLERANCE = 0.25
+SUB_MS_TOLERANCE = 0.75
+BASELINE_RUNS = 3
+SEED_BATCH = 10000
+
+# Calls measured per path and dataset; password hashing makes the auth paths slow
+SAMPLES = {
+    'login_user': 30,
+    'get_health_profile': 3000,
+    'generate_health_plan': 3000,
+    'signup': 30,
+}
+# The sub-millisecond paths get untimed calls first, so caches warmed by an earlier
+# dataset don't make the first size look slower, and several rounds
+WARMUP = 300
+ROUNDS = 5
+
+PASSWORD = 'benchmark-pass'
+GOALS = ('Lose Weight', 'Gain Muscle', 'Improve Endurance', 'Maintain Fitness')
+ACTIVITY_LEVELS = ('Sedentary', 'Lightly Active', 'Moderately Active', 'Very Active', 'Super Active')
+DIETS = ('Vegetarian', 'Non-Vegetarian', 'Vegan')
+INJURIES = ('', '', '', 'sore knee', 'lower back pain', 'shoulder impingement')
+ILLNESSES = ('', '', '', 'high BP', 'type 2 diabetes', 'asthma and acid reflux')
+
+
+def summarise(durations_ns):
+    """p50/p95/p99 latency in ms and sequential throughput for a list of call durations."""
+    cuts = statistics.quantiles(durations_ns, n=100, method='inclusive')
+    return {
+        'samples': len(durations_ns),
+        'p50_ms': round(cuts[49] / 1e6, 4),
+        'p95_ms': round(cuts[94] / 1e6, 4),
+        'p99_ms': round(cuts[98] / 1e6, 4),
+        'ops_per_s': round(len(durations_ns) / (sum(durations_ns) / 1e9), 1),
+    }
+
+
+def measure(func, calls, warmup=0, rounds=1):
+    """
+    Times func(*args) for each args tuple in `calls`, after `warmup` untimed calls.
+    With several rounds the fastest one (by p50) is kept, as timeit keeps the best
+    repeat: slower rounds mostly measure other load on the machine.
+    """
+    for args in calls[:warmup]:
+        func(*args)
+    best = None
+    for _ in range(rounds):
+        durations = []
+        for args in calls:
+            start = time.perf_counter_ns()
+            func(*args)
+            durations.append(time.perf_counter_ns() - start)
+        stats = summarise(durations)
+        if best is None or stats['p50_ms'] < best['p50_ms']:
+            best = stats
+    return best
+
+
+def in_batches(rows, size=SEED_BATCH):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def synthetic_profiles(size, rng):
+    """(user_id, age, height_ft, height_in, weight_kg, activity, goal, diet, injury, illness) rows."""
+    for user_id in range(1, size + 1):
+        yield (
+            user_id, rng.randint(18, 75), rng.randint(4, 6), rng.randint(0, 11), round(rng.uniform(45, 130), 1),
+            rng.choice(ACTIVITY_LEVELS), rng.choice(GOALS), rng.choice(DIETS), rng.choice(INJURIES),
+            rng.choice(ILLNESSES),
+        )
+
+
+# --- Streamlit app (AI/) ---
+
+def run_ai(sizes, seed):
+    sys.path[:0] = [os.path.join(ROOT, 'AI'), ROOT]
+    import db
+    import hashing
+    import migrations
+    import users
+    from health_profile import HealthProfile
+    from plans import generate_health_plan
+
+    # Every seeded user shares one bcrypt hash; hashing a million passwords would
+    # take hours and login cost doesn't depend on which hash is checked
+    password_hash = hashing.hash_password(PASSWORD)
+    results = {}
+    for size in sizes:
+        rng = random.Random(seed)
+        workdir = tempfile.mkdtemp(prefix='aifit-bench-')
+        try:
+            # db.DB_PATH is relative, so the pool opens credentials.db in the temp directory
+            os.chdir(workdir)
+            db.get_pool().close_all()
+            with db.connection() as conn:
+                migrations.migrate(conn)
+                conn.executemany(
+                    "INSERT INTO users (id, username, contact, email, gender, address, password_hash) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((i, f'user{i}', f'{7000000000 + i}', f'user{i}@example.com', rng.choice(('Male', 'Female')),
+                      'Benchmark Street', password_hash) for i in range(1, size + 1))
+                )
+                conn.executemany(
+                    f"INSERT INTO health_profiles ({HealthProfile.SELECT_LIST}) VALUES ({', '.join('?' * 10)})",
+                    synthetic_profiles(size, rng)
+                )
+
+            def login(username):
+                if not users.login_user(username, PASSWORD):
+                    sys.exit(f"login_user failed for {username}")
+
+            user_ids = [rng.randint(1, size) for _ in range(max(SAMPLES.values()))]
+            results[f'login_user@{size}'] = measure(
+                login, [(f'user{user_id}',) for user_id in user_ids[:SAMPLES['login_user']]]
+            )
+            results[f'get_health_profile@{size}'] = measure(
+                users.get_health_profile, [(user_id,) for user_id in user_ids[:SAMPLES['get_health_profile']]],
+                warmup=WARMUP, rounds=ROUNDS,
+            )
+            profiles = [users.get_health_profile(user_id) for user_id in user_ids[:SAMPLES['generate_health_plan']]]
+            results[f'generate_health_plan@{size}'] = measure(
+                generate_health_plan, [(profile, rng.choice(('Male', 'Female'))) for profile in profiles],
+                warmup=WARMUP, rounds=ROUNDS,
+            )
+        finally:
+            db.get_pool().close_all()
+            os.chdir(ROOT)
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+# --- Flask app (AI Fitness2/) ---
+
+def run_flask(sizes, seed):
+    from werkzeug.security import generate_password_hash
+
+    password_hash = generate_password_hash(PASSWORD, method='pbkdf2:sha256')
+    results = {}
+    for size in sizes:
+        rng = random.Random(seed)
+        # The app opens instance/fitnesscare.db next to app.py when it is imported, so
+        # each dataset runs a fresh copy of the app (and the shared package) in a temp dir
+        workdir = tempfile.mkdtemp(prefix='aifit-bench-')
+        ignore = shutil.ignore_patterns('instance', '__pycache__')
+        shutil.copytree(os.path.join(ROOT, 'AI Fitness2'), os.path.join(workdir, 'AI Fitness2'), ignore=ignore)
+        shutil.copytree(os.path.join(ROOT, 'shared'), os.path.join(workdir, 'shared'), ignore=ignore)
+        code = (
+            "import sys, json; sys.path.insert(0, sys.argv[1]); sys.path.insert(0, sys.argv[2]);"
+            "import hot_paths_bench; print(json.dumps(hot_paths_bench.measure_flask_app("
+            "int(sys.argv[3]), int(sys.argv[4]), sys.argv[5])))"
+        )
+        try:
+            output = subprocess.run(
+                [sys.executable, '-c', code, os.path.join(workdir, 'AI Fitness2'), os.path.dirname(__file__),
+                 str(size), str(rng.randrange(2 ** 32)), password_hash],
+                check=True, capture_output=True, text=True,
+            ).stdout
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        results[f'signup@{size}'] = json.loads(output.splitlines()[-1])
+    return results
+
+
+def measure_flask_app(size, seed, password_hash):
+    """Runs inside a process that has the copied Flask app first on sys.path."""
+    import app as flask_app
+
+    rng = random.Random(seed)
+    with flask_app.app.app_context():
+        table = flask_app.User.__table__
+        for batch in in_batches(
+            {'username': f'user{i}', 'email': f'user{i}@example.com', 'password': password_hash,
+             'age': rng.randint(18, 75), 'contact': f'{7000000000 + i}', 'gender': rng.choice(('male', 'female')),
+             'address': 'Benchmark Street'}
+            for i in range(1, size + 1)
+        ):
+            flask_app.db.session.execute(table.insert(), batch)
+        flask_app.db.session.commit()
+        # What a restarted app would load at import
+        flask_app.user_index.load(flask_app.db.session.query(
+            flask_app.User.username, flask_app.User.email, flask_app.User.contact))
+
+    def signup(i):
+        response = flask_app.app.test_client().post('/signup', data={
+            'username': f'new{i}', 'email': f'new{i}@example.com', 'password': PASSWORD, 'age': '30',
+            'contact': f'{9000000000 + i}', 'gender': 'female', 'address': 'Benchmark Street',
+        })
+        if response.status_code != 302:
+            sys.exit(f"signup failed with status {response.status_code}")
+
+    return measure(signup, [(i,) for i in range(SAMPLES['signup'])])
+
+
+# --- Baseline comparison ---
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+def save_baseline(path, results):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'machine': f"{platform.machine()} {platform.processor() or platform.system()}, {os.cpu_count()} CPUs",
+            'python': platform.python_version(),
+            'results': results,
+        }, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def combine_runs(runs):
+    """
+    The median run (by p50) of each path, with the tolerance its p50 spread across
+    the runs calls for: twice (slowest / fastest - 1), rounded up to 5%, and at
+    least the floor for its latency (SUB_MS_TOLERANCE below 1 ms, else TOLERANCE).
+    """
+    combined = {}
+    for key in runs[0]:
+        ordered = sorted((run[key] for run in runs), key=lambda stats: stats['p50_ms'])
+        spread = ordered[-1]['p50_ms'] / ordered[0]['p50_ms'] - 1
+        median = ordered[len(ordered) // 2]
+        floor = SUB_MS_TOLERANCE if median['p50_ms'] < 1 else TOLERANCE
+        combined[key] = {**median, 'tolerance': max(floor, round(math.ceil(2 * spread * 20) / 20, 2))}
+    return combined
+
+
+def report(results, baseline, tolerance=None):
+    """
+    Prints every result next to its baseline and returns the keys that regressed.
+    Each path is allowed its baseline tolerance unless `tolerance` overrides it.
+    """
+    regressions = []
+    print(f"{'path':<36}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>11}{'p50 vs base':>13}{'allowed':>9}")
+    for key in sorted(results, key=lambda k: (k.split('@')[0], int(k.split('@')[1]))):
+        stats, base = results[key], baseline.get(key)
+        change, allowed, flag = '', '', ''
+        if base:
+            limit = tolerance if tolerance is not None else base.get('tolerance', TOLERANCE)
+            change, allowed = f"{stats['p50_ms'] / base['p50_ms'] - 1:+.0%}", f"{limit:+.0%}"
+            if stats['p50_ms'] > base['p50_ms'] * (1 + limit):
+                regressions.append(key)
+                flag = '  REGRESSED'
+        elif 'tolerance' in stats:
+            allowed = f"{stats['tolerance']:+.0%}"
+        print(f"{key:<36}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}"
+              f"{stats['ops_per_s']:>11,.0f}{change:>13}{allowed:>9}{flag}")
+    return regressions
+
+
+def run_apps(sizes, seed):
+    """One measurement of every path in both apps, each app in its own subprocess."""
+    results = {}
+    for app in APPS:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--app', app, '--sizes', sizes, '--seed', str(seed)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results.update(json.loads(output.splitlines()[-1]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the auth, profile and plan hot paths.")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated dataset sizes (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--tolerance', type=float, default=None,
+                        help="allowed p50 slowdown for every path (default: each path's baseline tolerance)")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="store the median of --runs runs as the baseline instead of comparing")
+    parser.add_argument('--runs', type=int, default=BASELINE_RUNS,
+                        help="runs measured by --update-baseline (default: %(default)s)")
+    parser.add_argument('--app', choices=APPS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    if args.app:
+        run = run_ai if args.app == 'ai' else run_flask
+        print(json.dumps({f'{args.app}.{key}': stats for key, stats in run(sizes, args.seed).items()}))
+        return
+
+    if args.update_baseline:
+        if args.runs < 2:
+            parser.error("--runs must be at least 2 to measure each path's noise")
+        results = combine_runs([run_apps(args.sizes, args.seed) for _ in range(args.runs)])
+        # Keep baseline entries for sizes this run didn't cover
+        save_baseline(args.baseline, {**load_baseline(args.baseline), **results})
+        report(results, {})
+        print(f"Baseline written to {os.path.relpath(args.baseline, ROOT)}")
+        return
+
+    results = run_apps(args.sizes, args.seed)
+    regressions = report(results, load_baseline(args.baseline), args.tolerance)
+    if regressions:
+        sys.exit(f"{len(regressions)} path(s) slower than the baseline: {', '.join(regressions)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Per-request cost of signup validation for both apps: the previous inline checks
+against shared.validation.validate_signup.
+
+    python benchmarks/validation_bench.py [iterations]
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.validation import validate_signup
+
+FLASK_FORM = {
+    'username': 'alex', 'email': 'alex@example.com', 'password': 'secret1', 'age': '29',
+    'contact': '9876543210', 'gender': 'male', 'address': '1 Main Street',
+}
+STREAMLIT_FORM = {
+    'username': 'alex', 'contact': '9876543210', 'email': 'alex@example.com', 'gender': 'Male',
+    'address': '1 Main Street', 'password': 'secret1', 're_password': 'secret1',
+}
+
+
+def flask_inline(form):
+    import re
+    email_regex = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+    if not re.match(email_regex, form['email']):
+        return "Invalid email format."
+    elif len(form['contact']) != 10 or not form['contact'].isdigit():
+        return "Contact number must be exactly 10 digits."
+    return None
+
+
+def streamlit_inline(form):
+    if not all(form.values()):
+        return "Please fill in all the fields."
+    elif form['password'] != form['re_password']:
+        return "Passwords do not match."
+    elif len(form['password']) < 6:
+        return "Password must be at least 6 characters long."
+    elif not re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", form['email']):
+        return "Please enter a valid email address."
+    elif not re.match(r"^\d{10}$", form['contact']):
+        return "Contact number must be a 10-digit number."
+    return None
+
+
+def per_call_us(func, form, iterations):
+    best = min(timeit.repeat(lambda: func(form), number=iterations, repeat=5))
+    return best / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{'case':<32}{'us/request':>12}")
+    for label, func, form in (
+        ('flask: inline (before)', flask_inline, FLASK_FORM),
+        ('flask: validate_signup', validate_signup, FLASK_FORM),
+        ('streamlit: inline (before)', streamlit_inline, STREAMLIT_FORM),
+        ('streamlit: validate_signup', validate_signup, STREAMLIT_FORM),
+    ):
+        print(f"{label:<32}{per_call_us(func, form, iterations):>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
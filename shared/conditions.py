@@ -0,0 +1,49 @@
+import json
+import os
+from collections import namedtuple
+
+from shared.phrase_matcher import PhraseMatcher
+
+# Medical conditions and their synonyms live in data/conditions.json. Every synonym
+# is compiled into one PhraseMatcher at import, so free-text notes are mapped to
+# canonical conditions in a single pass however large the dictionary grows.
+# A condition may exclude a vaguer one its synonyms also match, e.g. 'type 1
+# diabetes' also contains 'diabetes', which on its own means type 2.
+CATALOGUE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'conditions.json')
+
+Condition = namedtuple('Condition', ['key', 'label', 'diet', 'avoid', 'warning', 'excludes'])
+
+
+def _load_catalogue():
+    with open(CATALOGUE_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+    conditions = {
+        key: Condition(key, spec['label'], spec['diet'], frozenset(spec['avoid']), spec['warning'],
+                       frozenset(spec.get('excludes', ())))
+        for key, spec in data.items()
+    }
+    synonyms = {synonym: key for key, spec in data.items() for synonym in spec['synonyms']}
+    return conditions, synonyms
+
+
+# Built once at import
+CONDITIONS, SYNONYMS = _load_catalogue()
+MATCHER = PhraseMatcher(SYNONYMS)
+
+
+def match(*texts):
+    """The canonical Conditions named in free-text notes, in catalogue order."""
+    keys = set()
+    for text in texts:
+        keys |= MATCHER.find(text)
+    for key in list(keys):
+        keys -= CONDITIONS[key].excludes
+    return tuple(condition for key, condition in CONDITIONS.items() if key in keys)
+
+
+def excluded_exercises(conditions):
+    """Every exercise the given conditions rule out."""
+    avoid = set()
+    for condition in conditions:
+        avoid |= condition.avoid
+    return frozenset(avoid)
@@ -0,0 +1,109 @@
+import json
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+from shared.phrase_matcher import PhraseMatcher
+
+# Exercises are annotated with how hard they load each body region (1 = moderate,
+# 2 = high) in data/exercises.json. An exercise is contraindicated for an injured
+# region it loads highly; it is then swapped for its first listed substitute that
+# is safe for every injured region, or dropped when none is. Exercises ruled out
+# for other reasons (see shared/conditions.py) are substituted the same way.
+CATALOGUE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'exercises.json')
+HIGH_LOAD = 2
+
+ExerciseInfo = namedtuple('ExerciseInfo', ['name', 'muscles', 'loads', 'substitutes'])
+Substitution = namedtuple('Substitution', ['original', 'replacement'])  # replacement is None when dropped
+Advisory = namedtuple('Advisory', ['regions', 'avoid', 'substitutions', 'advice'])
+
+
+def _load_catalogue():
+    with open(CATALOGUE_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+    regions = {name: spec['advice'] for name, spec in data['regions'].items()}
+    keywords = {
+        keyword.lower(): region
+        for region, spec in data['regions'].items()
+        for keyword in spec['keywords']
+    }
+    exercises = {
+        name: ExerciseInfo(name, tuple(spec['muscles']), dict(spec['loads']), tuple(spec['substitutes']))
+        for name, spec in data['exercises'].items()
+    }
+    return regions, keywords, exercises
+
+
+def _build_contraindications(exercises):
+    # Inverted index: region -> exercises that load it highly
+    index = {region: set() for region in REGION_ADVICE}
+    for exercise in exercises.values():
+        for region, load in exercise.loads.items():
+            if load >= HIGH_LOAD:
+                index[region].add(exercise.name)
+    return {region: frozenset(names) for region, names in index.items()}
+
+
+# Built once at import
+REGION_ADVICE, KEYWORDS, EXERCISES = _load_catalogue()
+CONTRAINDICATED = _build_contraindications(EXERCISES)
+KEYWORD_MATCHER = PhraseMatcher(KEYWORDS)
+
+
+def regions_for(text):
+    """The body regions named in free-text injury notes, e.g. 'bad knee' -> {'knee'}."""
+    return KEYWORD_MATCHER.find(text)
+
+
+def contraindicated(regions):
+    """Every catalogued exercise to avoid for the given injured regions."""
+    avoid = set()
+    for region in regions:
+        avoid |= CONTRAINDICATED.get(region, frozenset())
+    return frozenset(avoid)
+
+
+@lru_cache(maxsize=4096)
+def substitute(name, regions, excluded=frozenset()):
+    """
+    The exercise to do instead of `name` for these injured regions (a frozenset),
+    also avoiding any `excluded` exercises: `name` itself when it is safe or not
+    catalogued, else the first safe substitute, else None.
+    """
+    avoid = contraindicated(regions) | excluded
+    if name not in avoid:
+        return name
+    for candidate in EXERCISES[name].substitutes:
+        if candidate not in avoid:
+            return candidate
+    return None
+
+
+def adapt_exercises(names, regions, excluded=frozenset()):
+    """Returns (kept or replacement names in order, Substitutions made) for a workout."""
+    if not (regions or excluded):
+        return list(names), []
+    result, substitutions = [], []
+    for name in names:
+        replacement = substitute(name, regions, excluded)
+        if replacement != name:
+            substitutions.append(Substitution(name, replacement))
+        if replacement is not None:
+            result.append(replacement)
+    return result, substitutions
+
+
+def advise(injury_text, exercises=None):
+    """
+    Builds an Advisory for free-text injury notes: the regions recognised, the
+    catalogued exercises to avoid (or, given a workout's `exercises`, how each
+    one is substituted) and recovery advice per region.
+    """
+    regions = regions_for(injury_text)
+    substitutions = adapt_exercises(exercises, regions)[1] if exercises is not None else []
+    return Advisory(
+        regions=tuple(sorted(regions)),
+        avoid=tuple(sorted(contraindicated(regions))),
+        substitutions=tuple(substitutions),
+        advice=tuple((region, REGION_ADVICE[region]) for region in sorted(regions)),
+    )
@@ -0,0 +1,119 @@
+from collections import namedtuple
+from itertools import product
+
+# --- Inputs to the Mifflin-St Jeor equation and the per-goal calorie/macro rules ---
+ACTIVITY_MULTIPLIERS = {
+    "Sedentary": 1.2,
+    "Lightly Active": 1.375,
+    "Moderately Active": 1.55,
+    "Very Active": 1.725,
+    "Super Active": 1.9,
+}
+DEFAULT_ACTIVITY = "Sedentary"
+
+# BMR sex constants. "Other" uses the midpoint; an unknown sex keeps the original
+# male-only formula so callers that don't pass one get the same numbers as before.
+SEX_CONSTANTS = {
+    "Male": 5,
+    "Female": -161,
+    "Other": -78,
+}
+DEFAULT_SEX = "Male"
+
+# Calorie rule (offset from TDEE, or a fixed target), the offset used instead once an
+# adaptive TDEE is known (see AI/adaptive_tdee.py), and macro split as shares of calories
+GoalRule = namedtuple('GoalRule', ['calorie_offset', 'fixed_calories', 'adaptive_offset', 'protein', 'fat', 'carbs'])
+KCAL_PER_GRAM = {'protein': 4, 'fat': 9, 'carbs': 4}
+
+
+def _shares(calories, protein_g, fat_g, carbs_g):
+    # Macro shares of `calories` that reproduce these gram amounts exactly
+    return (
+        protein_g * KCAL_PER_GRAM['protein'] / calories,
+        fat_g * KCAL_PER_GRAM['fat'] / calories,
+        carbs_g * KCAL_PER_GRAM['carbs'] / calories,
+    )
+
+
+# Gain Muscle's split is the one its 6-meal plan adds up to (3000 kcal: 260 g protein,
+# 67 g fat, 365 g carbs, see AI/plan_content/diets.json), so the summary targets and
+# the meal list's daily total agree (with an adaptive TDEE, plans.scale_meals scales
+# the meals to the new targets). The meal macros come to slightly more energy
+# than their stated calories, so these shares sum to a little over 1.
+GAIN_MUSCLE_MEALS = (3000, 260, 67, 365)
+
+GOAL_RULES = {
+    "Lose Weight": GoalRule(-500, None, -500, 0.30, 0.25, 0.45),
+    "Gain Muscle": GoalRule(0, 3000, 300, *_shares(*GAIN_MUSCLE_MEALS)),
+    "Improve Endurance": GoalRule(0, None, 0, 0.20, 0.20, 0.60),
+    "Maintain Fitness": GoalRule(0, None, 0, 0.20, 0.30, 0.50),
+}
+DEFAULT_GOAL = "Maintain Fitness"
+
+Coefficients = namedtuple('Coefficients', [
+    'activity_multiplier', 'sex_constant', 'calorie_offset', 'fixed_calories', 'adaptive_offset',
+    'protein_g_per_kcal', 'fat_g_per_kcal', 'carbs_g_per_kcal',
+])
+NutritionTargets = namedtuple('NutritionTargets', ['bmr', 'tdee', 'calories', 'protein_g', 'fat_g', 'carbs_g'])
+
+
+def _build_coefficients(goal, activity_level, sex):
+    rule = GOAL_RULES[goal]
+    return Coefficients(
+        activity_multiplier=ACTIVITY_MULTIPLIERS[activity_level],
+        sex_constant=SEX_CONSTANTS[sex],
+        calorie_offset=rule.calorie_offset,
+        fixed_calories=rule.fixed_calories,
+        adaptive_offset=rule.adaptive_offset,
+        protein_g_per_kcal=rule.protein / KCAL_PER_GRAM['protein'],
+        fat_g_per_kcal=rule.fat / KCAL_PER_GRAM['fat'],
+        carbs_g_per_kcal=rule.carbs / KCAL_PER_GRAM['carbs'],
+    )
+
+
+# Goal x activity x sex table, computed once at import
+COEFFICIENTS = {
+    key: _build_coefficients(*key)
+    for key in product(GOAL_RULES, ACTIVITY_MULTIPLIERS, SEX_CONSTANTS)
+}
+
+
+def normalise_keys(goal, activity_level, sex):
+    """Maps free-form profile values onto the table keys, applying the defaults."""
+    return (
+        goal if goal in GOAL_RULES else DEFAULT_GOAL,
+        activity_level if activity_level in ACTIVITY_MULTIPLIERS else DEFAULT_ACTIVITY,
+        sex if sex in SEX_CONSTANTS else DEFAULT_SEX,
+    )
+
+
+def coefficients(goal, activity_level, sex=None):
+    return COEFFICIENTS[normalise_keys(goal, activity_level, sex)]
+
+
+def height_to_cm(height_ft, height_in):
+    return (height_ft * 30.48) + (height_in * 2.54)
+
+
+def calculate_targets(weight_kg, height_cm, age, activity_level, goal, sex=None, adaptive_tdee=None):
+    """
+    Daily targets from the Mifflin-St Jeor TDEE, or from `adaptive_tdee` (an estimate
+    fitted to the user's logged weight) when one is given; fixed goal targets such as
+    Gain Muscle's 3000 kcal only apply without it.
+    """
+    c = coefficients(goal, activity_level, sex)
+    bmr = (10 * weight_kg) + (6.25 * height_cm) - (5 * age) + c.sex_constant
+    if adaptive_tdee is not None:
+        tdee = int(adaptive_tdee)
+        calories = int(tdee + c.adaptive_offset)
+    else:
+        tdee = int(bmr * c.activity_multiplier)
+        calories = c.fixed_calories if c.fixed_calories is not None else int(tdee + c.calorie_offset)
+    return NutritionTargets(
+        bmr=bmr,
+        tdee=tdee,
+        calories=calories,
+        protein_g=round(calories * c.protein_g_per_kcal),
+        fat_g=round(calories * c.fat_g_per_kcal),
+        carbs_g=round(calories * c.carbs_g_per_kcal),
+    )
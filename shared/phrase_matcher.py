@@ -0,0 +1,65 @@
+import re
+from collections import deque
+
+# Anything that isn't a letter or digit separates words, so 'High-BP', 'high bp'
+# and 'HIGH  BP.' are all the words ('high', 'bp').
+_WORD = re.compile(r'[0-9a-z]+')
+
+
+def words(text):
+    """The lower-cased words of `text`, punctuation and spacing dropped."""
+    return _WORD.findall((text or '').lower())
+
+
+class PhraseMatcher:
+    """
+    Finds which of a fixed set of phrases occur in free text, as whole words, in a
+    single pass. Phrases are compiled once into an Aho-Corasick automaton over
+    words (a trie with failure links), so matching costs one dict lookup per word
+    of text however many phrases there are. Each phrase maps to a value, e.g. a
+    synonym to its canonical condition, and find() returns the set of values matched.
+    """
+
+    __slots__ = ('_delta', '_output')
+
+    def __init__(self, phrases):
+        goto, output = [{}], [set()]
+        for phrase, value in phrases.items():
+            state = 0
+            for word in words(phrase):
+                if word not in goto[state]:
+                    goto.append({})
+                    output.append(set())
+                    goto[state][word] = len(goto) - 1
+                state = goto[state][word]
+            if state:
+                output[state].add(value)
+
+        # Breadth-first, so a state's failure target is always finished before it.
+        # Failure links are folded into a full transition table (delta), so matching
+        # never has to follow them: a word no phrase continues with goes back to the root.
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for word, child in goto[state].items():
+                queue.append(child)
+                fail[child] = delta[fail[state]].get(word, 0) if state else 0
+                output[child] |= output[fail[child]]
+
+        self._delta = tuple(delta)
+        self._output = tuple(frozenset(values) for values in output)
+
+    def find(self, text):
+        """The values of every phrase occurring in `text`, as a frozenset."""
+        delta, output = self._delta, self._output
+        found = set()
+        state = 0
+        for word in words(text):
+            state = delta[state].get(word, 0)
+            if output[state]:
+                found |= output[state]
+        return frozenset(found)
@@ -0,0 +1,73 @@
+import re
+
+# Compiled once at import; every signup reuses the same automata.
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+CONTACT_PATTERN = re.compile(r"\d{10}")
+AGE_PATTERN = re.compile(r"\d{1,3}")
+
+MIN_PASSWORD_LENGTH = 6
+MIN_AGE, MAX_AGE = 1, 120
+MIN_HEIGHT_CM, MAX_HEIGHT_CM = 50, 250
+MIN_WEIGHT_KG, MAX_WEIGHT_KG = 20, 300
+
+REQUIRED_MESSAGE = "Please fill in all the fields."
+EMAIL_MESSAGE = "Please enter a valid email address."
+CONTACT_MESSAGE = "Contact number must be exactly 10 digits."
+AGE_MESSAGE = "Please enter a valid age."
+PASSWORD_LENGTH_MESSAGE = f"Password must be at least {MIN_PASSWORD_LENGTH} characters long."
+PASSWORD_MATCH_MESSAGE = "Passwords do not match."
+HEIGHT_MESSAGE = f"Please enter a height between {MIN_HEIGHT_CM} and {MAX_HEIGHT_CM} cm."
+WEIGHT_MESSAGE = f"Please enter a weight between {MIN_WEIGHT_KG} and {MAX_WEIGHT_KG} kg."
+
+
+def validate_signup(fields):
+    """
+    Validates a signup form in one pass and returns every error message (empty if
+    the form is valid). `fields` maps form field names to the submitted strings;
+    only the fields present are checked, so each app passes the fields its form has.
+    A `re_password` entry is checked against `password`.
+    """
+    errors = []
+    if not all(fields.values()):
+        errors.append(REQUIRED_MESSAGE)
+    email = fields.get('email')
+    if email and not EMAIL_PATTERN.fullmatch(email):
+        errors.append(EMAIL_MESSAGE)
+    contact = fields.get('contact')
+    if contact and not CONTACT_PATTERN.fullmatch(contact):
+        errors.append(CONTACT_MESSAGE)
+    age = fields.get('age')
+    if age and not (AGE_PATTERN.fullmatch(age) and MIN_AGE <= int(age) <= MAX_AGE):
+        errors.append(AGE_MESSAGE)
+    password = fields.get('password')
+    if password and len(password) < MIN_PASSWORD_LENGTH:
+        errors.append(PASSWORD_LENGTH_MESSAGE)
+    if 're_password' in fields and fields['re_password'] != password:
+        errors.append(PASSWORD_MATCH_MESSAGE)
+    return errors
+
+
+def _number_between(value, low, high):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return False
+    return low <= number <= high
+
+
+def validate_measurements(fields):
+    """
+    Validates the height (cm), weight (kg) and age strings of a profile form and
+    returns every error message, like validate_signup.
+    """
+    errors = []
+    if not all(fields.get(field) for field in ('height', 'weight', 'age')):
+        errors.append(REQUIRED_MESSAGE)
+    height, weight, age = fields.get('height'), fields.get('weight'), fields.get('age')
+    if height and not _number_between(height, MIN_HEIGHT_CM, MAX_HEIGHT_CM):
+        errors.append(HEIGHT_MESSAGE)
+    if weight and not _number_between(weight, MIN_WEIGHT_KG, MAX_WEIGHT_KG):
+        errors.append(WEIGHT_MESSAGE)
+    if age and not (AGE_PATTERN.fullmatch(age) and MIN_AGE <= int(age) <= MAX_AGE):
+        errors.append(AGE_MESSAGE)
+    return errors